@@ -5,10 +5,11 @@ Module for analysis and presentation of telemetric scans to the user.
 from math import degrees
 
 from astropy import units as u
+import numpy as np
 from numpy import round as npr
 
 from astronautica.config import Scan as Cfg
-from astronautica.engine import geometry
+from astronautica.engine.space import Coordinates, geometry
 
 
 def get_name(obj: dict) -> str:
@@ -28,31 +29,36 @@ def get_data(data, *, indent=1) -> list:
     pad = " " * (Cfg.indent * indent)
     o = []
 
-    if isinstance(data, geometry.Coordinates):
-        # Include Cartesian Position, simple position of this object in Vector3
-        pos, vel = npr(data.position, Cfg.decimals), npr(data.velocity, Cfg.decimals)
+    if isinstance(data, Coordinates):
+        # Include Cartesian Position, relative to the Primary rather than to the
+        #   floating Origin of the Domain, and Velocity
+        absolute = data.position_absolute
+        pos, vel = npr(absolute, Cfg.decimals), npr(data.velocity, Cfg.decimals)
         o.append("Pos+Vel: {}m + {}m/s\n".format(pos, vel))
 
+        # Convert Position, Velocity and Facing to Spherical all at once
+        (dist, *pos), (spd, *direc), (_, *heading) = geometry.to_spherical_array(
+            np.array((absolute, data.velocity, geometry.facing(data.heading)))
+        )
+
         # Include Distance and Bearing, direction in which this object is seen
-        dist, *pos = data.position_pol
         o.append("Distance: {}".format(npr(dist * u.meter, Cfg.decimals)))
         if dist > 0:
             o.append("Bearing: [θ={}°, φ={}°]\n".format(*npr(pos, Cfg.decimals)))
 
         # Include Speed and Course, direction this object is moving
-        spd, *direc = data.velocity_pol
         o.append("Speed: {}".format(npr(spd * u.meter / u.second, Cfg.decimals)))
         if spd > 0:
             o.append("Course: [θ={}°, φ={}°]\n".format(*npr(direc, Cfg.decimals)))
 
         # Include Heading, direction this object is facing
-        _, *heading = geometry.cart3_polar3(*geometry.facing(data.heading))
         o.append("Heading: [θ={}°, φ={}°]\n".format(*npr(heading, Cfg.decimals)))
 
         # Include Spin and Axis (of rotation), describing rotational velocity
         spin, axis = geometry.break_rotor(data.rotate)
         o.append("Spin: {}°/s".format(npr(degrees(spin), Cfg.decimals)))
         if spin != 0:
+            _, *axis = geometry.to_spherical(*axis)
             o.append("-Axis: [θ={}°, φ={}°]".format(*npr(axis, Cfg.decimals)))
 
     return [pad + line for line in o if line]
@@ -7,19 +7,23 @@ The Engine Package contains most of the "moving parts" of the Game World. It
 """
 
 from asyncio import CancelledError, sleep
-from collections import defaultdict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime as dt, timedelta as td
+from functools import partial
 from inspect import isawaitable
 from time import time
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional
 
 from ezipc import err
 from ezipc.util import echo
 
-from .collision import find_collisions
+from .collision import CollisionQueue, Packed, safe_step
 from .objects import Object
 from .serial import deserialize, Serial, Serializable
 from .space import Coordinates, LocalSpace, Space
+from .space.forces import gravity_step
+from .space.integrators import INTEGRATORS
 from .world import Clock, Galaxy, MultiSystem, System
 
 
@@ -47,64 +51,169 @@ class RealTime(Clock):
 
 class Spacetime:
     __slots__ = (
+        "adaptive",
+        "gravity",
         "space",
+        "workers",
         "world",
     )
 
-    def __init__(self, space_: Space = None, world_: Galaxy = None):
+    def __init__(
+        self,
+        space_: Space = None,
+        world_: Galaxy = None,
+        workers: int = 1,
+        adaptive: bool = False,
+        gravity: str = None,
+        integrator: str = None,
+    ):
         self.space: Space = space_ or Space()
         self.world: Galaxy = world_
-
-    def _tick(self, target: float = 1, allow_collision: bool = True) -> int:
+        # Domains never interact with each other, so if more than one Worker is
+        #   allowed, they are Ticked concurrently in a Thread Pool. Each Worker
+        #   operates only on the slices of the Space Arrays belonging to its
+        #   own Domain. Changes to the structure of the Space made meanwhile,
+        #   such as by `Object.on_collide()`, must go through `Space.defer()`.
+        self.workers: int = workers
+        # If Adaptive, each Domain takes the largest steps of time which are
+        #   safe for it, rather than a fixed number of steps.
+        self.adaptive: bool = adaptive
+        # Forces applied through every step: None, "primary" for the pull of
+        #   each Domain Primary, or "mutual" to also include the pull of every
+        #   massive Object upon the others.
+        self.gravity: Optional[str] = gravity
+        # Scheme used to advance each step: "euler" or "verlet". If not given,
+        #   the Integrator of the Space is kept.
+        if integrator is not None:
+            self.space.integrator = INTEGRATORS[integrator]()
+
+    def _tick(
+        self, target: float = 1, allow_collision: bool = True, pool: Executor = None
+    ) -> int:
         """Simulate the passing of time. The target amount should be one second
             divided by a power of two.
         """
-        key = lambda o: o[0]
+        jobs = [local for local in self.space.all_domains() if local.used]
+
+        if pool is None:
+            hits = sum(
+                self._tick_domain(local, target, allow_collision) for local in jobs
+            )
+        else:
+            # Workers hold Views of the Arrays, so the Space must not change
+            #   shape until every one has finished.
+            self.space.concurrent = True
+            try:
+                hits = sum(
+                    pool.map(
+                        lambda local: self._tick_domain(
+                            local, target, allow_collision
+                        ),
+                        jobs,
+                    )
+                )
+            finally:
+                self.space.concurrent = False
+            self.space.run_deferred()
+
+        # Moving Frames touches more than one Domain, so it is done serially,
+        #   once every Domain has finished its Tick.
+        self.space.migrate()
+        self.space.recenter()
+        return hits
+
+    def _tick_domain(
+        self, local: LocalSpace, target: float = 1, allow_collision: bool = True
+    ) -> int:
+        """Simulate the passing of time within only one Domain."""
+        domain: int = local.index
         hits: int = 0
         passed: float = 0
-        collisions: List[Tuple[float, Tuple[Object, Object]]] = []
-        objs = self.objects
-
-        # Repeat this until there are no Collisions left to be simulated.
-        while allow_collision and (
-            collisions := find_collisions(target - passed, objs)
-        ):
-            # Find the soonest Collision.
-            seconds, (obj_a, obj_b) = min(collisions, key=key)
-
-            # Progress Time to the point of the soonest Collision.
-            self.space.progress(seconds - passed)
-            passed += seconds
-
-            # Simulate the Collision.
-            obj_a.collide_with(obj_b)
-            hits += 1
-            # Objects have now had their Velocities changed. Future Collisions
-            #   may no longer be valid, so recalculate the Collisions which have
-            #   not happened yet.
 
-        # Then, simulate the rest of the time.
-        self.space.progress(target - passed)
-        return hits
+        if self.gravity:
+            accel = partial(local.acceleration, self.gravity == "mutual")
+        else:
+            accel = None
 
-    @property
-    def index(self) -> Dict[LocalSpace, List[Object]]:
-        out: Dict[LocalSpace, List[Object]] = defaultdict(list)
+        if allow_collision and len(local.objects) > 1:
+            queue = CollisionQueue(target, [Packed.from_domain(local)])
 
-        for obj in Object.ALL:
-            if obj.frame.domain:
-                out[obj.frame.domain].append(obj)
+            # Repeat this until there are no Collisions left to be simulated.
+            while event := queue.pop():
+                seconds, (obj_a, obj_b) = event
 
-        return out
+                # Progress Time to the point of the soonest Collision.
+                self.space.progress_domain(domain, seconds - passed, accel)
+                passed = seconds
 
-    @property
-    def objects(self) -> List[Tuple[List[Object], List[Object]]]:
-        return [(l, l.copy()) for l in self.index.values()]
+                # Simulate the Collision.
+                obj_a.collide_with(obj_b)
+                hits += 1
+                # Objects have now had their Velocities changed. Collisions
+                #   involving them may no longer be valid, so recalculate only
+                #   those.
+                queue.update(passed, obj_a, obj_b)
 
-    def progress(self, seconds: int, granularity: int = 2):
-        """Simulate the passing of time."""
+        # Then, simulate the rest of the time.
+        self.space.progress_domain(domain, target - passed, accel)
+        return hits
+
+    def _advance_domain(
+        self, local: LocalSpace, seconds: float, step_min: float
+    ) -> int:
+        """Simulate the passing of time within one Domain, taking the largest
+            steps which are safe, but none smaller than `step_min`. Return the
+            number of steps taken.
+        """
+        passed: float = 0
+        steps: int = 0
+
+        while passed < seconds:
+            remaining = seconds - passed
+            _objs, slots = local.registry
+            step = safe_step(
+                remaining,
+                local.array_position,
+                local.array_velocity,
+                slots,
+                local.array_radius[slots],
+            )
+            if self.gravity:
+                step = min(
+                    step,
+                    gravity_step(
+                        local.array_absolute,
+                        local.space.array_active[local.index],
+                        local.gm,
+                    ),
+                )
+            step = min(remaining, max(step, step_min))
+
+            self._tick_domain(local, step)
+            passed += step
+            steps += 1
+
+        return steps
+
+    @property
+    def index(self) -> Dict[LocalSpace, List[Object]]:
+        return {
+            local: local.registry[0]
+            for local in self.space.all_domains()
+            if local.objects
+        }
+
+    def progress(
+        self, seconds: int, granularity: int = 2, adaptive: bool = None
+    ) -> int:
+        """Simulate the passing of time. Return the number of steps taken,
+            summed across all Domains.
+
+        In Adaptive mode, every Domain is stepped separately, and only steps as
+            finely as `granularity` while Objects in it are near each other.
+        """
         if seconds == 0:
-            return
+            return 0
         elif seconds < 0:
             raise ValueError(
                 "Unfortunately, the Laws of Thermodynamics prohibit time reversal."
@@ -114,8 +223,27 @@ class Spacetime:
         elif not is_power_of_2(granularity):
             raise ValueError("Progression Granularity must be an integral power of 2.")
 
-        for i in range(seconds * granularity):
-            self._tick(1 / granularity, True)
+        if adaptive is None:
+            adaptive = self.adaptive
+
+        jobs = [local for local in self.space.all_domains() if local.used]
+
+        with (
+            ThreadPoolExecutor(self.workers) if self.workers > 1 else nullcontext()
+        ) as pool:
+            if adaptive:
+                advance = lambda local: self._advance_domain(
+                    local, seconds, 1 / granularity
+                )
+                steps = sum(pool.map(advance, jobs) if pool else map(advance, jobs))
+                self.space.migrate()
+                self.space.recenter()
+                return steps
+
+            else:
+                for i in range(seconds * granularity):
+                    self._tick(1 / granularity, True, pool)
+                return seconds * granularity * len(jobs)
 
     async def run(self, turn_length: int = 300):
         try:
@@ -132,12 +260,12 @@ class Spacetime:
                 await run_iter(CB_PRE_TICK)
 
                 try:
-                    self.progress(turn_length)
+                    steps = self.progress(turn_length)
                 except Exception as e:
                     err("Failed to progress Time:", e)
                     raise e
                 else:
-                    echo("Simulation complete.")
+                    echo(f"Simulation complete in {steps} steps.")
 
                 await run_iter(CB_POST_TICK)
                 tick_next += turn
@@ -0,0 +1,106 @@
+"""Module providing Benchmarks of the numerical methods of the Engine, to help
+    choose between them.
+
+Each Benchmark returns a Dict of its measurements, so that it may be printed
+    from a console or compared programmatically.
+"""
+
+from time import perf_counter
+from typing import Dict
+
+import numpy as np
+
+from .space.forces import accelerate_barnes_hut, accelerate_mutual, accelerate_primary
+from .space.integrators import INTEGRATORS
+
+
+__all__ = ["energy_drift", "gravity"]
+
+
+def energy_drift(
+    step: float,
+    orbits: int = 10,
+    eccentricity: float = 0.1,
+    radius: float = 7e6,
+    gm: float = 3.986e14,
+) -> Dict[str, float]:
+    """Compare the Integrators by following a single Orbit about a Primary for
+        several periods with a fixed step.
+
+    Return, for each Integrator, the time taken in seconds, and the worst
+        relative error in the specific orbital energy seen along the way.
+    """
+    # Start at Periapsis, with the speed of an Orbit of the given shape.
+    periapsis = radius * (1 - eccentricity)
+    speed = np.sqrt(gm * (1 + eccentricity) / periapsis)
+    period = 2 * np.pi * np.sqrt(radius ** 3 / gm)
+    steps = int(np.ceil(orbits * period / step))
+    active = np.ones(1, np.bool_)
+
+    def energy(position, velocity) -> float:
+        return velocity[0] @ velocity[0] / 2 - gm / np.linalg.norm(position[0])
+
+    result = {"step": step, "steps": steps}
+    for name, cls in INTEGRATORS.items():
+        integrator = cls()
+        position = np.array([[periapsis, 0.0, 0.0]])
+        velocity = np.array([[0.0, speed, 0.0]])
+
+        def acceleration() -> np.ndarray:
+            out = np.zeros_like(position)
+            accelerate_primary(position, active, gm, out)
+            return out
+
+        initial = energy(position, velocity)
+        error = 0.0
+        integrator.step(position, velocity, active, 0.0, acceleration)
+
+        start = perf_counter()
+        for _ in range(steps):
+            integrator.step(position, velocity, active, step, acceleration)
+            error = max(error, abs(energy(position, velocity) / initial - 1))
+
+        result[name] = perf_counter() - start
+        result[f"{name}_drift"] = float(error)
+
+    return result
+
+
+def gravity(
+    bodies: int, theta: float = 0.5, repeat: int = 5, seed: int = None
+) -> Dict[str, float]:
+    """Compare the Barnes-Hut Octree against direct summation for a random
+        cluster of massive Bodies.
+
+    Return the best time of each Backend, in seconds, along with the median and
+        maximum error of the Octree relative to direct summation.
+    """
+    rng = np.random.default_rng(seed)
+    position = rng.normal(scale=1e9, size=(bodies, 3))
+    mass = rng.uniform(1e20, 1e24, bodies)
+    active = np.ones(bodies, np.bool_)
+
+    def best(func, *a) -> float:
+        times = []
+        for _ in range(repeat):
+            out = np.zeros((bodies, 3))
+            start = perf_counter()
+            func(position, mass, active, out, *a)
+            times.append(perf_counter() - start)
+        return min(times)
+
+    direct = np.zeros((bodies, 3))
+    tree = np.zeros((bodies, 3))
+    accelerate_mutual(position, mass, active, direct)
+    accelerate_barnes_hut(position, mass, active, tree, theta)
+
+    error = np.linalg.norm(tree - direct, axis=1) / np.linalg.norm(direct, axis=1)
+
+    return {
+        "bodies": bodies,
+        "theta": theta,
+        "direct": best(accelerate_mutual),
+        "barnes-hut": best(accelerate_barnes_hut, theta),
+        "error_median": float(np.median(error)),
+        "error_max": float(np.max(error)),
+    }
@@ -4,283 +4,354 @@
 Uses Numba for JIT Compilation.
 """
 
-from typing import List, Optional, Tuple
+from heapq import heappop, heappush
+from itertools import count
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 from numba import jit
 import numpy as np
 
 from .objects import Object
+from .space import LocalSpace
+
+__all__ = [
+    "CollisionQueue",
+    "find_impacts",
+    "impacts_of",
+    "Packed",
+    "safe_step",
+    "sweep_and_prune",
+    "time_of_impact",
+]
+
+
+@jit(nopython=True, nogil=True)
+def sweep_and_prune(
+    seconds: float, positions: np.ndarray, velocities: np.ndarray, radii: np.ndarray
+) -> np.ndarray:
+    """Broad Phase: Given the Positions, Velocities and Radii of N Objects,
+        return an Array of Index Pairs, shaped (K, 2), whose Bounding Boxes
+        overlap at some point over the next `seconds`.
+
+    Each Box is swept along the straight path of its Object, so any Pair NOT
+        returned cannot possibly collide during this time. Boxes are sorted by
+        their lower bound along the Axis with the greatest spread, and swept
+        across; Only Boxes which are still "open" when another begins need to
+        be compared, which is close to linear for sparse Domains.
+    """
+    n = positions.shape[0]
+    if n < 2:
+        return np.empty((0, 2), np.int64)
+
+    lo = np.empty((n, 3))
+    hi = np.empty((n, 3))
+
+    for i in range(n):
+        for k in range(3):
+            start = positions[i, k]
+            end = start + velocities[i, k] * seconds
+            if start < end:
+                lo[i, k] = start - radii[i]
+                hi[i, k] = end + radii[i]
+            else:
+                lo[i, k] = end - radii[i]
+                hi[i, k] = start + radii[i]
+
+    # Sweep along whichever Axis separates the Boxes the most.
+    axis = 0
+    spread = -1.0
+    for k in range(3):
+        s = np.var(lo[:, k])
+        if s > spread:
+            axis = k
+            spread = s
+
+    order = np.argsort(lo[:, axis])
+    active = np.empty(n, np.int64)
+    n_active = 0
+    pairs = []
+
+    for o in range(n):
+        i = order[o]
+        kept = 0
+
+        for a in range(n_active):
+            j = active[a]
+            if hi[j, axis] < lo[i, axis]:
+                # Box J ended before Box I began; It cannot overlap any Box
+                #   after this one either.
+                continue
+
+            active[kept] = j
+            kept += 1
+
+            for k in range(3):
+                if hi[i, k] < lo[j, k] or hi[j, k] < lo[i, k]:
+                    break
+            else:
+                pairs.append((min(i, j), max(i, j)))
 
-__all__ = ["distance_between_lines", "find_collisions"]
-
-
-@jit(looplift=True)
-def _find_collision(
-    pos_a: np.ndarray,
-    vel_a: np.ndarray,
-    pos_b: np.ndarray,
-    vel_b: np.ndarray,
-    time_min: float,
-    time_max: float,
-    contact: float,
-):
-    result = 0
-    error = 0
-
-    def distance_at(time):
-        a = pos_a + vel_a * time
-        b = pos_b + vel_b * time
-        return float(np.sqrt(np.sum(np.square(a - b))))
-
-    dist_min: float = distance_at(time_min)
-    dist_max: float = distance_at(time_max)
-
-    # graph = {time_min: dist_min, time_max: dist_max}
-
-    i = 0
-    while contact - error > 0.001 and i < 100:
-        # Repeat the following over an increasingly precise window of time.
-        time_mid = (time_min + time_max) / 2
-        dist_mid = distance_at(time_mid)
-        i += 1
-
-        # graph[time_mid] = dist_mid
-
-        if dist_min < contact:
-            # The objects are in contact at the start of this window. Do not
-            #   interact.
-            return False
-            # result = False
-            # break
-
-        elif dist_mid < contact:
-            # The objects are in contact halfway through this window, but not
-            #   the start. Slice the first half of the window.
-            result = time_mid
-            error = dist_mid
-            time_max = time_mid
-            dist_max = dist_mid
-
-        elif dist_max < contact:
-            # The objects are in contact at the end of this window, but not at
-            #   the midpoint. Slice the second half of the window.
-            result = time_max
-            error = dist_max
-            time_min = time_mid
-            dist_min = dist_mid
-
-        else:
-            # The objects are not in contact at any known point; However, they
-            #   may still pass through each other between points. Check the
-            #   distance differences to find which half of this window would
-            #   contain the pass.
-            half_0 = dist_mid - dist_min  # Change in distance over the first half
-            half_1 = dist_max - dist_mid  # Change in distance over the second half
-
-            if half_0 == -half_1:
-                # Vergence is constant.
-                result = False
-                break
-
-            elif half_0 == -half_1:
-                # Midpoint is the closest together the objects come.
-                result = False
-                break
-
-            elif dist_min < dist_mid < dist_max:
-                # The objects seem to be diverging, but may have passed.
-
-                if half_0 > half_1:
-                    # First half is greater change than second half;
-                    # If they pass, it happens in the second half.
-                    time_min = time_mid
-                    dist_min = dist_mid
-
-                else:  # half_0 < half_1
-                    # First half is smaller change than second half;
-                    # If they pass, it happens in the first half.
-                    time_max = time_mid
-                    dist_max = dist_mid
-
-            elif dist_min > dist_mid > dist_max or (
-                dist_min > dist_mid and dist_max > dist_mid
-            ):
-                # The objects seem to be converging, or to have passed.
-
-                if half_0 < half_1:
-                    # First half is smaller change than second half;
-                    # If they pass, it happens in the first half.
-                    time_min = time_mid
-                    dist_min = dist_mid
-
-                else:  # half_0 > half_1
-                    # First half is greater change than second half;
-                    # If they pass, it happens in the second half.
-                    time_max = time_mid
-                    dist_max = dist_mid
+        n_active = kept
+        active[n_active] = i
+        n_active += 1
 
-            else:
-                # No other condition could result in an impact
-                result = False
-                break
-
-    # print(i, repr({k: graph[k] for k in sorted(graph.keys())}))
-    return result
-
-
-@jit(forceobj=True, nopython=False)
-def find_collisions(
-    seconds: float, objs: List[Tuple[List[Object], List[Object]]]
-) -> List[Tuple[float, Tuple[Object, Object]]]:
-    collisions: List[Tuple[float, Tuple[Object, Object]]] = []
-
-    for list_a, list_b in objs:
-        for obj_a in list_a[-1:0:-1]:
-            list_b.pop(-1)
-            start_a = obj_a.frame.position
-            end_a = obj_a.frame.position + obj_a.frame.velocity * seconds
-
-            for obj_b in list_b:
-                if obj_a.frame.domain != obj_b.frame.domain:
-                    continue
-                start_b = obj_b.frame.position
-                contact = obj_a.radius + obj_b.radius
-
-                if (start_a - start_b).length < contact:
-                    continue
-
-                end_b = obj_b.frame.position + obj_b.frame.velocity * seconds
-                nearest_a, nearest_b, proximity = distance_between_lines(
-                    start_a, end_a, start_b, end_b
-                )
-
-                if proximity < contact:
-                    # Objects look like they might collide.
-                    impact = _find_collision(
-                        obj_a.frame.position,
-                        obj_a.frame.velocity,
-                        obj_b.frame.position,
-                        obj_b.frame.velocity,
-                        0.0,
-                        seconds,
-                        contact,
-                    )
-                    if impact is not False:
-                        collisions.append((impact, (obj_a, obj_b)))
-
-    return collisions
-
-
-# Implementation by Fnord on StackOverflow
-# https://stackoverflow.com/a/18994296
-
-
-@jit(forceobj=True, nopython=False)
-def distance_between_lines(
-    a0: np.ndarray,
-    a1: np.ndarray,
-    b0: np.ndarray,
-    b1: np.ndarray,
-    clampAll: bool = True,
-    clampA0: bool = False,
-    clampA1: bool = False,
-    clampB0: bool = False,
-    clampB1: bool = False,
-) -> Tuple[Optional[np.ndarray], Optional[np.ndarray], float]:
-    """ Given two lines defined by numpy.array pairs (a0,a1,b0,b1)
-        Return the closest points on each segment and their distance
+    out = np.empty((len(pairs), 2), np.int64)
+    for p in range(len(pairs)):
+        out[p, 0], out[p, 1] = pairs[p]
+
+    return out
+
+
+@jit(nopython=True, nogil=True)
+def time_of_impact(
+    seconds: float, offsets: np.ndarray, velocities: np.ndarray, contact: np.ndarray
+) -> np.ndarray:
+    """Narrow Phase: Given the relative Positions and Velocities of N Pairs of
+        Objects, shaped (N, 3), and the distance at which each Pair makes
+        contact, return the time of first contact for every Pair, or NaN where
+        the Pair does not come into contact within `seconds`.
+
+    Under linear motion, the separation of a Pair at time t is |p + vt|, so
+        contact begins at the lesser root of the quadratic:
+            (v • v)t² + 2(p • v)t + (p • p - c²) = 0
+
+    Pairs which are already in contact at the start are NOT considered to
+        collide, so that they may finish separating.
+    """
+    n = offsets.shape[0]
+    out = np.full(n, np.nan)
+
+    for i in range(n):
+        a = 0.0
+        b = 0.0
+        c = -contact[i] * contact[i]
+        for k in range(3):
+            a += velocities[i, k] * velocities[i, k]
+            b += offsets[i, k] * velocities[i, k]
+            c += offsets[i, k] * offsets[i, k]
+
+        if c < 0 or a == 0 or b >= 0:
+            # Already in contact, not moving relative to each other, or moving
+            #   apart.
+            continue
+
+        disc = b * b - a * c
+        if disc < 0:
+            # Closest approach is farther apart than the contact distance.
+            continue
+
+        t = (-b - np.sqrt(disc)) / a
+        if t <= seconds:
+            out[i] = t
+
+    return out
+
+
+@jit(nopython=True, nogil=True)
+def find_impacts(
+    seconds: float,
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    slots: np.ndarray,
+    radii: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Run both Phases of Collision Detection over the Objects of one Domain.
+
+    `positions` and `velocities` are the full Arrays of a LocalSpace, `slots`
+        are the Indices of the Objects within them, and `radii` is parallel to
+        `slots`. Return the Pairs which collide within `seconds`, as Indices
+        into `slots`, and the times at which they do.
+    """
+    pos = positions[slots]
+    vel = velocities[slots]
+
+    pairs = sweep_and_prune(seconds, pos, vel, radii)
+    a = pairs[:, 0]
+    b = pairs[:, 1]
+    impacts = time_of_impact(
+        seconds, pos[b] - pos[a], vel[b] - vel[a], radii[a] + radii[b]
+    )
+
+    hit = ~np.isnan(impacts)
+    return pairs[hit], impacts[hit]
+
+
+@jit(nopython=True, nogil=True)
+def impacts_of(
+    seconds: float,
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    slots: np.ndarray,
+    radii: np.ndarray,
+    k: int,
+) -> np.ndarray:
+    """Find the times at which the K-th Object in `slots` would collide with
+        each of the others within `seconds`. Its own time is always NaN.
+    """
+    pos = positions[slots]
+    vel = velocities[slots]
+
+    impacts = time_of_impact(seconds, pos - pos[k], vel - vel[k], radii + radii[k])
+    impacts[k] = np.nan
+    return impacts
+
+
+@jit(nopython=True, nogil=True)
+def safe_step(
+    horizon: float,
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    slots: np.ndarray,
+    radii: np.ndarray,
+    safety: float = 0.25,
+) -> float:
+    """Return the largest step of time, up to `horizon`, which is safe to take
+        in one Domain.
+
+    Only Pairs which may come near each other within `horizon`, according to
+        the Broad Phase, constrain the step. For each of them, the step may be
+        no longer than a fraction (`safety`) of the time it would take to close
+        the gap between them at their current relative speed.
+    """
+    pos = positions[slots]
+    vel = velocities[slots]
+    step = horizon
+
+    pairs = sweep_and_prune(horizon, pos, vel, radii)
+    for p in range(pairs.shape[0]):
+        a = pairs[p, 0]
+        b = pairs[p, 1]
+        gap = np.sqrt(np.sum(np.square(pos[b] - pos[a]))) - radii[a] - radii[b]
+        speed = np.sqrt(np.sum(np.square(vel[b] - vel[a])))
+
+        if gap > 0 and speed > 0:
+            step = min(step, safety * gap / speed)
+
+    return step
+
+
+class Packed(NamedTuple):
+    """The Objects of one Domain, along with their Slots in the Arrays of the
+        Domain, and a parallel Array of their Radii.
+    """
+
+    domain: LocalSpace
+    objs: List[Object]
+    slots: np.ndarray
+    radii: np.ndarray
+
+    @classmethod
+    def from_domain(cls, domain: LocalSpace) -> "Packed":
+        objs, slots = domain.registry
+        return cls(domain, objs, slots, domain.array_radius[slots])
+
+    @classmethod
+    def from_objects(cls, objs: List[Object]) -> "Packed":
+        return cls(
+            objs[0].frame.domain,
+            objs,
+            np.array([obj.frame.index for obj in objs], dtype=np.int64),
+            np.array([obj.radius for obj in objs], dtype=float),
+        )
+
+    def find_collisions(
+        self, seconds: float
+    ) -> List[Tuple[float, Tuple[Object, Object]]]:
+        pairs, impacts = find_impacts(
+            seconds,
+            self.domain.array_position,
+            self.domain.array_velocity,
+            self.slots,
+            self.radii,
+        )
+        return [
+            (impact, (self.objs[i], self.objs[j]))
+            for (i, j), impact in zip(pairs.tolist(), impacts.tolist())
+        ]
+
+
+class CollisionQueue(object):
+    """Queue of the Collisions which will take place within one Tick, ordered
+        by time of impact. Times are measured from the start of the Tick.
+
+    When two Objects collide, only Collisions involving one of them can have
+        changed, so rather than searching every Domain again, the queued
+        Collisions of those two Objects are invalidated, and only their Pairs
+        are recalculated.
     """
 
-    # If clampAll=True, set all clamps to True
-    if clampAll:
-        clampA0 = True
-        clampA1 = True
-        clampB0 = True
-        clampB1 = True
-
-    # Calculate denomitator
-    A = np.subtract(a1, a0)
-    B = np.subtract(b1, b0)
-    magA = np.linalg.norm(A)
-    magB = np.linalg.norm(B)
-
-    # print(f"\n\n{A} / {magA}; {B} / {magB}")
-    _A = np.true_divide(A, magA) if magA != 0 else A
-    _B = np.true_divide(B, magB) if magB != 0 else B
-    # print(f"{_A}, {_B}")
-
-    cross = np.cross(_A, _B)
-    denom = np.square(np.linalg.norm(cross))
-
-    # If lines are parallel (denom=0) test if lines overlap.
-    # If they don't overlap then there is a closest point solution.
-    # If they do overlap, there are infinite closest positions, but there is a closest distance
-    if not denom:
-        d0 = np.dot(_A, (b0 - a0))
-
-        # Overlap only possible with clamping
-        if clampA0 or clampA1 or clampB0 or clampB1:
-            d1 = np.dot(_A, (b1 - a0))
-
-            # Is segment B before A?
-            if d0 <= 0 >= d1:
-                if clampA0 and clampB1:
-                    if np.absolute(d0) < np.absolute(d1):
-                        return a0, b0, np.linalg.norm(a0 - b0)
-                    return a0, b1, np.linalg.norm(a0 - b1)
-
-            # Is segment B after A?
-            elif d0 >= magA <= d1:
-                if clampA1 and clampB0:
-                    if np.absolute(d0) < np.absolute(d1):
-                        return a1, b0, np.linalg.norm(a1 - b0)
-                    return a1, b1, np.linalg.norm(a1 - b1)
-
-        # Segments overlap, return distance between parallel segments
-        return None, None, np.linalg.norm(((d0 * _A) + a0) - b0)
-
-    # Lines criss-cross: Calculate the projected closest points
-    t = np.subtract(b0, a0)
-
-    # print(f"\n\ndetA = det({[t, _B, cross]}); detB = det({[t, _A, cross]})")
-    detA = np.linalg.det([t, _B, cross])
-    detB = np.linalg.det([t, _A, cross])
-    # print(f"{detA}, {detB}")
-
-    t0 = detA / denom
-    t1 = detB / denom
-
-    pA = a0 + (_A * t0)  # Projected closest point on segment A
-    pB = b0 + (_B * t1)  # Projected closest point on segment B
-
-    # Clamp projections
-    if clampA0 or clampA1 or clampB0 or clampB1:
-        if clampA0 and t0 < 0:
-            pA = a0
-        elif clampA1 and t0 > magA:
-            pA = a1
-
-        if clampB0 and t1 < 0:
-            pB = b0
-        elif clampB1 and t1 > magB:
-            pB = b1
-
-        # Clamp projection A
-        if (clampA0 and t0 < 0) or (clampA1 and t0 > magA):
-            dot = np.dot(_B, (pA - b0))
-            if clampB0 and dot < 0:
-                dot = 0
-            elif clampB1 and dot > magB:
-                dot = magB
-            pB = b0 + (_B * dot)
-
-        # Clamp projection B
-        if (clampB0 and t1 < 0) or (clampB1 and t1 > magB):
-            dot = np.dot(_A, (pB - a0))
-            if clampA0 and dot < 0:
-                dot = 0
-            elif clampA1 and dot > magA:
-                dot = magA
-            pA = a0 + (_A * dot)
-
-    return pA, pB, np.linalg.norm(pA - pB)
+    __slots__ = (
+        "heap",
+        "members",
+        "seq",
+        "target",
+        "versions",
+    )
+
+    def __init__(self, target: float, domains: Iterable[Packed]):
+        self.target: float = target
+        self.heap: List[Tuple[float, int, Object, Object, int, int]] = []
+        self.members: Dict[Object, Tuple[Packed, int]] = {}
+        self.seq = count()
+        self.versions: Dict[Object, int] = {}
+
+        for packed in domains:
+            if len(packed.objs) < 2:
+                continue
+
+            for k, obj in enumerate(packed.objs):
+                self.members[obj] = (packed, k)
+                self.versions[obj] = 0
+
+            for impact, (obj_a, obj_b) in packed.find_collisions(target):
+                self.push(impact, obj_a, obj_b)
+
+    def push(self, impact: float, obj_a: Object, obj_b: Object) -> None:
+        heappush(
+            self.heap,
+            (
+                impact,
+                next(self.seq),
+                obj_a,
+                obj_b,
+                self.versions[obj_a],
+                self.versions[obj_b],
+            ),
+        )
+
+    def pop(self) -> Optional[Tuple[float, Tuple[Object, Object]]]:
+        """Remove and return the soonest Collision which is still valid, or
+            None if there are none left.
+        """
+        while self.heap:
+            impact, _, obj_a, obj_b, ver_a, ver_b = heappop(self.heap)
+            if ver_a == self.versions[obj_a] and ver_b == self.versions[obj_b]:
+                return impact, (obj_a, obj_b)
+
+        return None
+
+    def update(self, now: float, *changed: Object) -> None:
+        """The given Objects have had their Velocities changed at time `now`.
+            Invalidate their queued Collisions, and find their new ones over
+            the rest of the Tick.
+        """
+        for obj in changed:
+            self.versions[obj] += 1
+
+        done = set()
+        for obj in changed:
+            packed, k = self.members[obj]
+            impacts = impacts_of(
+                self.target - now,
+                packed.domain.array_position,
+                packed.domain.array_velocity,
+                packed.slots,
+                packed.radii,
+                k,
+            )
+            done.add(obj)
+
+            for i in np.flatnonzero(~np.isnan(impacts)).tolist():
+                other = packed.objs[i]
+                if other not in done:
+                    self.push(now + impacts[i], obj, other)
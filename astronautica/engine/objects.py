@@ -1,5 +1,5 @@
 """Module implementing the Base Class for all Objects which reside in Space."""
-from typing import Tuple, Set
+from typing import Tuple
 
 from astropy import units as u
 from attr import asdict, attrs
@@ -29,13 +29,11 @@ class Object(Node):
         "frame",
     )
 
-    ALL: Set["Object"] = set()
-
     def __init__(self, data: dict = None, frame: Coordinates = None):
         self.data = Data(**(data or {}))
         self.frame = frame
 
-        self.ALL.add(self)
+        self.register()
 
     @property
     def mass(self):
@@ -108,16 +106,28 @@ class Object(Node):
 
         This Method is called AFTER effects of the impact on velocity have been
             calculated and applied.
+
+        With more than one Worker, it may be called from a Worker Thread, while
+            other Domains are being progressed. Any change to the structure of
+            the Space, such as creating or releasing a Frame, must be passed to
+            `Space.defer()`, to be made once every Domain has finished.
         """
         pass
 
+    def register(self):
+        """Record this Object in the Registry of the Domain of its Frame. This
+            must be called again after changing the Mass or Radius.
+        """
+        if self.frame is not None and self.frame.domain is not None:
+            self.frame.domain.register(self)
+
     def clone(self: "Object") -> "Object":
         c = type(self)(asdict(self.data), self.frame.clone())
         return c
 
     def unlink(self):
-        if self in self.ALL:
-            self.ALL.remove(self)
+        if self.frame.domain is not None:
+            self.frame.domain.unregister(self)
         self.frame.detach()
 
     def serialize(self):
@@ -1,5 +1,3 @@
-from itertools import starmap
-
 # from sys import exit
 from matplotlib.figure import Figure
 from typing import Tuple
@@ -14,7 +12,7 @@ from mpl_toolkits.mplot3d import Axes3D
 import numpy as np
 from vectormath import Vector3
 
-from .space.geometry import from_spherical, to_spherical
+from .space.geometry import from_spherical, from_spherical_array, to_spherical
 
 
 T = Terminal()
@@ -76,11 +74,13 @@ def plot_spherical(
         points = np.array(points)
         return ax.plot(points[..., 0], points[..., 1], points[..., 2], **kw)
 
-    arc_theta = lambda d=1: starmap(
-        from_spherical, ((rho * d, (theta / seg * i), phi) for i in range(seg + 1))
+    steps = np.linspace(0, 1, seg + 1)
+    ones = np.ones_like(steps)
+    arc_theta = lambda d=1: from_spherical_array(
+        np.stack((ones * rho * d, steps * theta, ones * phi), 1)
     )
-    arc_phi = lambda d=1: starmap(
-        from_spherical, ((rho * d, 0, (phi / seg * i)) for i in range(seg + 1))
+    arc_phi = lambda d=1: from_spherical_array(
+        np.stack((ones * rho * d, steps * 0, steps * phi), 1)
     )
 
     # Y-axis Line.
@@ -231,9 +231,7 @@ def render_galaxy(
     fig = pyplot.figure(figsize=(size, size))
 
     ax = axes(fig, -scale, scale)
-    ax.scatter(
-        tuple(data[..., 0]), tuple(data[..., 1]), tuple(data[..., 2]), c="#000000", s=1
-    )
+    ax.scatter(data[..., 0], data[..., 1], data[..., 2], c="#000000", s=1)
 
     # pyplot.show()
     if filename:
@@ -16,18 +16,40 @@ Spherical Coordinates:
       Zenith: φ = 90°
 """
 
-from itertools import count
-from typing import Dict, Iterator, List, Optional, Sequence, Tuple
-from weakref import proxy
-
-from astropy import constants as const
-from numba import jit
+from heapq import heapify, heappop, heappush
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
+from weakref import finalize, proxy, WeakValueDictionary
+
+from astropy import units as u
 import numpy as np
-from quaternion import as_float_array, from_float_array, quaternion
+from quaternion import from_float_array, quaternion
 from vectormath import Vector3
 
 from . import base, position, rotation
-
+from .forces import (
+    accelerate_barnes_hut,
+    accelerate_mutual,
+    accelerate_primary,
+    BARNES_HUT_MIN,
+    G,
+    mass_of,
+)
+from .hierarchy import migrate, soi_radius
+from .integrators import Acceleration, Euler, Integrator
+from .kinematics import advance_headings
+
+if TYPE_CHECKING:
+    from ..objects import Object
 
 __all__ = ["base", "Coordinates", "LocalSpace", "position", "rotation", "Space"]
 
@@ -35,19 +57,43 @@ __all__ = ["base", "Coordinates", "LocalSpace", "position", "rotation", "Space"]
 INITIAL_DOMAINS = 5
 INITIAL_OBJECTS = 10
 
+# Edge length of a Sector, in meters. The Origin of every Domain lies on the
+#   corner of a Sector, so that moving it shifts Positions by exact multiples
+#   of a power of two, and loses no precision.
+SECTOR_SIZE: float = 2.0 ** 30
+
 
 class Space(object):
     """Coordinates tracker/handler object."""
 
     __slots__ = (
+        "array_active",
         "array_position",
         "array_velocity",
         "array_heading",
+        "array_mass",
+        "array_radius",
         "array_rotate",
+        "concurrent",
+        "deferred",
+        "domain_size",
         "domains",
+        "free_domains",
+        "integrator",
+    )
+
+    # Names of all Arrays which are indexed by Domain and Object Slot.
+    ARRAYS = (
+        "array_active",
+        "array_position",
+        "array_velocity",
+        "array_heading",
+        "array_mass",
+        "array_radius",
+        "array_rotate",
     )
 
-    def __init__(self, struct: dict = None):
+    def __init__(self, struct: dict = None, integrator: Integrator = None):
         """Initialize positions and velocities to be ndarrays, three dimensions
             deep.
 
@@ -61,8 +107,26 @@ class Space(object):
         self.array_velocity = np.zeros((INITIAL_DOMAINS, INITIAL_OBJECTS, 3))
         self.array_heading = np.zeros((INITIAL_DOMAINS, INITIAL_OBJECTS, 4))
         self.array_rotate = np.zeros((INITIAL_DOMAINS, INITIAL_OBJECTS, 4))
-
-        self.domains: Dict[int, List[int]] = {}
+        # Mask of the Slots which currently hold a Frame.
+        self.array_active = np.zeros((INITIAL_DOMAINS, INITIAL_OBJECTS), np.bool_)
+        # Mass (kg) and Radius (m) of the Objects registered to each Slot.
+        self.array_mass = np.zeros((INITIAL_DOMAINS, INITIAL_OBJECTS))
+        self.array_radius = np.zeros((INITIAL_DOMAINS, INITIAL_OBJECTS))
+
+        # Domains are held weakly, so that a Domain which is no longer used
+        #   anywhere else is collected, and its Index released.
+        self.domains: Dict[int, LocalSpace] = WeakValueDictionary()
+        # Heap of Domain Indices which have been released, and may be reused.
+        self.free_domains: List[int] = []
+        # High-water mark of Domain Indices ever handed out.
+        self.domain_size: int = 0
+        # Scheme used to advance Positions and Velocities through each step.
+        self.integrator: Integrator = integrator or Euler()
+        # Whether Domains are being progressed concurrently, by Worker Threads
+        #   which hold Views of the Arrays, and the changes to the structure of
+        #   the Space which must wait until they have finished.
+        self.concurrent: bool = False
+        self.deferred: List[Callable[[], object]] = []
 
         if struct is not None:
             struct["positions"] = self.array_position
@@ -75,7 +139,11 @@ class Space(object):
 
     @property
     def next_domain_index(self) -> int:
-        return next(i for i in count() if i not in self.domains)
+        if self.free_domains:
+            return self.free_domains[0]
+        else:
+            # Every Index below the high-water mark is either in use or free.
+            return self.domain_size
 
     @property
     def quat_heading(self) -> np.ndarray:
@@ -85,74 +153,104 @@ class Space(object):
     def quat_rotate(self) -> np.ndarray:
         return from_float_array(self.array_rotate)
 
+    def reserve(self, domains: int, objects: int) -> None:
+        """Ensure that the Arrays have room for at least the given numbers of
+            Domains and Objects.
+
+        Whenever an axis runs out of room, its capacity is doubled, so that the
+            cost of copying the Arrays is amortized to constant time per Slot.
+        """
+        cap_domains, cap_objects = self.array_position.shape[:2]
+        if domains <= cap_domains and objects <= cap_objects:
+            return
+        elif self.concurrent:
+            raise RuntimeError(
+                "Space cannot grow while Domains are progressed concurrently;"
+                " Pass the change to Space.defer()."
+            )
+
+        while cap_domains < domains:
+            cap_domains *= 2
+        while cap_objects < objects:
+            cap_objects *= 2
+
+        for name in self.ARRAYS:
+            old: np.ndarray = getattr(self, name)
+            new = np.zeros((cap_domains, cap_objects, *old.shape[2:]), old.dtype)
+            new[: old.shape[0], : old.shape[1]] = old
+            setattr(self, name, new)
+
+    def defer(self, change: Callable[[], object]) -> None:
+        """Make a change to the structure of the Space, such as adding or
+            releasing Frames or Domains, once no Domains are being progressed
+            concurrently. If none are, it is made at once.
+        """
+        if self.concurrent:
+            self.deferred.append(change)
+        else:
+            change()
+
+    def run_deferred(self) -> int:
+        """Make every change which was deferred. Return the number made."""
+        done = 0
+        while self.deferred:
+            self.deferred.pop(0)()
+            done += 1
+        return done
+
     def add_domain(self, domain: "LocalSpace") -> int:
         """Add a new Domain. A Domain is essentially a set of Arrays within the
             Space Arrays which represent a locality in Space. Objects must be in
             the same Domain in order to interact.
         """
-        next_domain: int = self.next_domain_index
-
-        # Place a Zero in the ID Dict to represent the new, empty, Domain.
-        self.domains[next_domain] = domain.used
-
-        shape = self.array_position.shape
-        while next_domain >= shape[0]:
-            # The Index of the new Domain is higher than the number of Arrays
-            #   available. Increase the size of the Array along the Domain axis.
-            #   To this end, initialize new Arrays of X Arrays of three Zeros,
-            #   where X is the number of Object Slots required in the new Domain
-            #   to maintain Shape.
-            self.array_position = np.append(
-                self.array_position, np.array([[[0, 0, 0]] * shape[1]]), 0
-            )
-            self.array_velocity = np.append(
-                self.array_velocity, np.array([[[0, 0, 0]] * shape[1]]), 0
-            )
-            self.array_heading = np.append(
-                self.array_heading, np.array([[[0, 0, 0, 0]] * shape[1]]), 0
-            )
-            self.array_rotate = np.append(
-                self.array_rotate, np.array([[[0, 0, 0, 0]] * shape[1]]), 0
+        if self.concurrent:
+            raise RuntimeError(
+                "Domains cannot be added while Domains are progressed"
+                " concurrently; Pass the change to Space.defer()."
             )
+        elif self.free_domains:
+            next_domain: int = heappop(self.free_domains)
+        else:
+            next_domain: int = self.domain_size
+            self.domain_size += 1
+            self.reserve(next_domain + 1, 0)
 
+        self.domains[next_domain] = domain
         return next_domain
 
+    def release_domain(self, domain: int) -> None:
+        """Free the Index of a Domain, and clear its Arrays, so that it may be
+            reused by a new Domain. The Domain may already have been collected.
+        """
+        if self.concurrent:
+            # Collected in the middle of a Tick; Release it once that is done.
+            self.deferred.append(lambda: self.release_domain(domain))
+        elif domain < self.domain_size and domain not in self.free_domains:
+            self.domains.pop(domain, None)
+            heappush(self.free_domains, domain)
+
+            for name in self.ARRAYS:
+                getattr(self, name)[domain] = 0
+
     def add_frame_to_domain(
         self, domain: "LocalSpace", frame: "Coordinates", index: int = None
     ) -> int:
         if index is None:
-            index = domain.next_object_index
+            index = domain.claim_index()
         elif index in domain.used:
             raise IndexError(f"Index {index} is already allocated.")
+        else:
+            domain.claim_index(index)
 
-        domain.used.append(index)
-
-        shape = self.array_position.shape
-        while index >= shape[1]:
-            # Increase the size of the Array along the Object axis.
-            self.array_position = np.append(
-                self.array_position, np.array([[[0, 0, 0]]] * shape[0]), 1
-            )
-            self.array_velocity = np.append(
-                self.array_velocity, np.array([[[0, 0, 0]]] * shape[0]), 1
-            )
-            self.array_heading = np.append(
-                self.array_heading, np.array([[[0, 0, 0, 0]]] * shape[0]), 1
-            )
-            self.array_rotate = np.append(
-                self.array_rotate, np.array([[[0, 0, 0, 0]]] * shape[0]), 1
-            )
+        domain.used.add(index)
+        self.reserve(0, domain.size)
+        self.array_active[domain.index, index] = True
 
         frame.domain = domain
         return index
 
     def all_domains(self) -> Iterator["LocalSpace"]:
-        for d in LocalSpace.ALL:
-            try:
-                if d.space is self:
-                    yield d
-            except:
-                continue
+        yield from self.domains.values()
 
     @staticmethod
     def all_frames() -> Iterator["Coordinates"]:
@@ -163,29 +261,91 @@ class Space(object):
             except:
                 continue
 
-    @jit(forceobj=True, nopython=False)
     def progress(self, time: float):
-        self.array_position += self.array_velocity * time
-        self.array_heading = as_float_array(
-            from_float_array(self.array_rotate * np.array((time, 1, 1, 1)))
-            * self.quat_heading
+        for domain, local in self.domains.items():
+            if local.used:
+                # Domains with no Frames have nothing to progress.
+                self.progress_domain(domain, time)
+
+    def progress_domain(
+        self, domain: int, time: float, acceleration: Acceleration = None
+    ):
+        """Progress only the slices of the Arrays belonging to one Domain.
+            Domains share no slices, so they may be progressed concurrently.
+
+        If given, `acceleration` is called by the Integrator to sample the
+            Accelerations of the Domain at its current Positions.
+        """
+        active = self.array_active[domain]
+        self.integrator.step(
+            self.array_position[domain],
+            self.array_velocity[domain],
+            active,
+            time,
+            acceleration,
+        )
+
+        advance_headings(
+            self.array_heading[domain], self.array_rotate[domain], active, time
         )
 
+    def migrate(self) -> int:
+        """Move Frames between Domains according to the Spheres of Influence of
+            their Primaries. Return the number of Frames moved.
+        """
+        return migrate(self.domains.values())
+
+    def recenter(self) -> int:
+        """Move the Origin of every Domain to the Sector nearest the middle of
+            its Frames. Return the number of Domains which moved.
+        """
+        return sum(bool(local.recenter().any()) for local in self.all_domains())
+
     def __getitem__(self, idx: int) -> "LocalSpace":
-        return tuple(ls for ls in LocalSpace.ALL if ls.index == idx)[0]
+        return self.domains[idx]
 
 
 class LocalSpace(object):
-    ALL: List["LocalSpace"] = []
-
-    def __init__(self, master, space: Space):
+    def __init__(
+        self,
+        master,
+        space: Space,
+        anchor: "Coordinates" = None,
+        soi: float = None,
+    ):
         self.master = master
         self.space: Space = space
-        self.used: List[int] = []
+        # Frame in the parent Domain at which the Origin of this Domain lies,
+        #   and the radius of its Sphere of Influence, in meters. If no radius
+        #   is given, it follows the distance of the Anchor from its Primary.
+        self.anchor: Optional[Coordinates] = anchor
+        self.soi: Optional[float] = soi
+        # Sector of the Origin of the Arrays, relative to the Primary. Stored
+        #   Positions are relative to this Origin, so they stay small, and
+        #   precise, however far the Frames are from the Primary.
+        self.sector: np.ndarray = np.zeros(3, np.int64)
+        # Standard Gravitational Parameter of the Primary, in m³/s².
+        self.gm: float = G * mass_of(master)
+        # Method of summing Mutual Gravity: "direct", "barnes-hut", or "auto"
+        #   to choose by the number of massive Objects. The Opening Angle sets
+        #   the accuracy of the Barnes-Hut Octree; Smaller is more accurate.
+        self.gravity_backend: str = "auto"
+        self.opening_angle: float = 0.5
+        self.used: Set[int] = set()
+        # Heap of Object Slots which have been released, and may be reused.
+        self.free_slots: List[int] = []
+        # High-water mark of Object Slots ever handed out in this Domain.
+        self.size: int = 0
+
+        # Registry of the Objects whose Frames occupy Slots in this Domain.
+        self.objects: Dict[int, "Object"] = {}
+        self._registry: Optional[Tuple[List["Object"], np.ndarray]] = None
 
         self.index: int = self.space.add_domain(self)
 
-        self.ALL.append(proxy(self, self.free_wr))
+        # Release the Index once this Domain is freed or collected. This must
+        #   not refer to the Domain, or it would never be collected.
+        self._release = finalize(self, space.release_domain, self.index)
 
     @property
     def array_position(self) -> Sequence[Vector3]:
@@ -219,6 +379,27 @@ class LocalSpace(object):
     def array_rotate(self, value: Sequence[np.ndarray]) -> None:
         self.space.array_rotate[self.index] = value
 
+    @property
+    def array_mass(self) -> np.ndarray:
+        return self.space.array_mass[self.index]
+
+    @property
+    def array_radius(self) -> np.ndarray:
+        return self.space.array_radius[self.index]
+
+    def state_of(
+        self, slots: Sequence[int]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the Positions, Velocities and Headings of the given Slots, as
+            Arrays shaped (N, 3), (N, 3) and (N, 4), gathered in one pass.
+        """
+        slots = np.asarray(slots, dtype=np.int64)
+        return (
+            self.array_position[slots],
+            self.array_velocity[slots],
+            self.array_heading[slots],
+        )
+
     @property
     def quat_heading(self) -> Sequence[quaternion]:
         return from_float_array(self.array_heading)
@@ -227,25 +408,155 @@ class LocalSpace(object):
     def quat_rotate(self) -> Sequence[quaternion]:
         return from_float_array(self.array_rotate)
 
+    @property
+    def origin(self) -> np.ndarray:
+        """Return the Position of the Origin of the Arrays, relative to the
+            Primary, in meters.
+        """
+        return self.sector * SECTOR_SIZE
+
+    @property
+    def array_absolute(self) -> np.ndarray:
+        """Return the Positions of this Domain relative to its Primary. This
+            is a copy, unless the Origin is on the Primary.
+        """
+        if self.sector.any():
+            return self.array_position + self.origin
+        else:
+            return self.array_position
+
+    def recenter(self, sector: Sequence[int] = None) -> np.ndarray:
+        """Move the Origin of the Arrays to a given Sector, or to the Sector
+            nearest the middle of the active Frames, and shift the Positions to
+            match. Return the change in Sector.
+        """
+        active = self.space.array_active[self.index]
+        if sector is None:
+            if not active.any():
+                return np.zeros(3, np.int64)
+            middle = self.array_position[active].mean(axis=0)
+            shift = np.round(middle / SECTOR_SIZE).astype(np.int64)
+        else:
+            shift = np.asarray(sector, np.int64) - self.sector
+
+        if shift.any():
+            self.array_position[active] -= shift * SECTOR_SIZE
+            self.sector += shift
+
+        return shift
+
+    def to_sector(self, pos: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Split a Position in the Arrays of this Domain into a Sector, relative
+            to the Primary, and an Offset within it.
+        """
+        shift = np.floor(np.asarray(pos) / SECTOR_SIZE + 0.5).astype(np.int64)
+        return self.sector + shift, pos - shift * SECTOR_SIZE
+
+    def from_sector(self, sector: Sequence[int], offset: np.ndarray) -> np.ndarray:
+        """Return the Position in the Arrays of this Domain of an Offset within
+            a Sector.
+        """
+        shift = np.asarray(sector, np.int64) - self.sector
+        return shift * SECTOR_SIZE + offset
+
+    @property
+    def parent(self) -> Optional["LocalSpace"]:
+        return self.anchor and self.anchor.domain
+
+    @property
+    def soi_radius(self) -> float:
+        parent = self.parent
+        if parent is None:
+            return np.inf
+        elif self.soi is not None:
+            return self.soi
+        else:
+            return soi_radius(
+                np.linalg.norm(parent.array_absolute[self.anchor.index]),
+                self.gm,
+                parent.gm,
+            )
+
     @property
     def next_object_index(self) -> int:
-        return next(i for i in count() if i not in self.used)
+        return self.free_slots[0] if self.free_slots else self.size
+
+    def claim_index(self, index: int = None) -> int:
+        """Take an Object Slot out of the free Slots. If no Index is given, the
+            lowest free Slot is reused, or a new one is appended.
+        """
+        if index is None:
+            if self.free_slots:
+                return heappop(self.free_slots)
+            index = self.size
+
+        if index >= self.size:
+            # Any Slots skipped over are free for later use.
+            for skipped in range(self.size, index):
+                heappush(self.free_slots, skipped)
+            self.size = index + 1
+        elif index in self.free_slots:
+            self.free_slots.remove(index)
+            heapify(self.free_slots)
+
+        return index
+
+    def release_index(self, index: int) -> None:
+        """Return an Object Slot to the free Slots, and clear its Values."""
+        if index in self.used:
+            self.used.remove(index)
+            heappush(self.free_slots, index)
+
+            if self.objects.pop(index, None) is not None:
+                self._registry = None
+
+            for name in self.space.ARRAYS:
+                getattr(self.space, name)[self.index, index] = 0
 
     def add_frame(self, frame: "Coordinates", index: int = None) -> int:
         return self.space.add_frame_to_domain(self, frame, index)
 
+    @property
+    def registry(self) -> Tuple[List["Object"], np.ndarray]:
+        """Return the Objects registered in this Domain, along with a parallel
+            Array of their Slots. This is only rebuilt after the Registry has
+            been changed.
+        """
+        if self._registry is None:
+            slots = sorted(self.objects)
+            self._registry = (
+                [self.objects[i] for i in slots],
+                np.array(slots, dtype=np.int64),
+            )
+        return self._registry
+
+    def register(self, obj: "Object") -> None:
+        """Record an Object, along with its Mass and Radius, in the Slot of its
+            Frame. Registering an Object again updates its values.
+        """
+        index = obj.frame.index
+        self.objects[index] = obj
+        self.array_mass[index] = obj.mass.to_value(u.kg)
+        self.array_radius[index] = obj.radius
+        self._registry = None
+
+    def unregister(self, obj: "Object") -> None:
+        index = obj.frame.index
+        if self.objects.get(index) is obj:
+            del self.objects[index]
+            self.array_mass[index] = 0
+            self.array_radius[index] = 0
+            self._registry = None
+
     def free(self):
-        if self.index in self.space.domain_indices:
-            del self.space.domain_indices[self.index]
+        self._release()
 
         self.space = None
         self.used.clear()
-
-    def free_wr(self, prox):
-        if prox in self.ALL:
-            self.ALL.remove(prox)
-
-        self.free()
+        self.free_slots.clear()
+        self.size = 0
+        self.objects.clear()
+        self._registry = None
 
     def all_frames(self) -> Iterator["Coordinates"]:
         for f in Coordinates.ALL:
@@ -255,12 +566,45 @@ class LocalSpace(object):
             except:
                 continue
 
-    @jit(nopython=True)
-    def gravitate(self, mass: float):
-        self.array_velocity -= np.array(
-            np.linalg.norm(vec) * ((const.G * mass) / np.square(vec.length))
-            for vec in self.array_position
-        )
+    def frames_at(self, slots: Sequence[int]) -> List["Coordinates"]:
+        """Return the Frames occupying the given Slots of this Domain."""
+        by_slot = {f.index: f for f in self.all_frames()}
+        return [by_slot[i] for i in slots if i in by_slot]
+
+    def acceleration(self, mutual: bool = False) -> np.ndarray:
+        """Return the Gravitational Acceleration of every Slot in this Domain:
+            toward the Primary, and, if Mutual, toward every massive Object.
+        """
+        out = np.zeros_like(self.array_position)
+        active = self.space.array_active[self.index]
+
+        accelerate_primary(self.array_absolute, active, self.gm, out)
+        if mutual:
+            backend = self.gravity_backend
+            if backend == "auto":
+                massive = np.count_nonzero(self.array_mass)
+                backend = "barnes-hut" if massive >= BARNES_HUT_MIN else "direct"
+
+            if backend == "barnes-hut":
+                accelerate_barnes_hut(
+                    self.array_position,
+                    self.array_mass,
+                    active,
+                    out,
+                    self.opening_angle,
+                )
+            elif backend == "direct":
+                accelerate_mutual(self.array_position, self.array_mass, active, out)
+            else:
+                raise ValueError(f"Unknown Gravity Backend: {backend!r}")
+
+        return out
+
+    def gravitate(self, time: float, mutual: bool = False) -> None:
+        """Apply the Gravitational Acceleration over `time` seconds to the
+            Velocities of this Domain.
+        """
+        self.array_velocity += self.acceleration(mutual) * time
 
     def __getitem__(self, idx: int) -> "Coordinates":
         return tuple(ls for ls in Coordinates.ALL if ls.index == idx)[0]
@@ -342,8 +686,8 @@ class Coordinates(object):
         )
 
     def free(self):
-        if self.index in self.domain.used:
-            self.domain.used.remove(self.index)
+        if self.domain is not None:
+            self.domain.release_index(self.index)
 
         self.domain = None
         self.index = -1
@@ -354,6 +698,69 @@ class Coordinates(object):
 
         self.free()
 
+    @property
+    def position_sector(self) -> Tuple[np.ndarray, Vector3]:
+        """Return the Position of this Frame relative to the Primary of its
+            Domain, split into an integer Sector and an Offset within it.
+        """
+        sector, offset = self.domain.to_sector(self.domain.array_position[self.index])
+        return sector, Vector3(offset)
+
+    @position_sector.setter
+    def position_sector(self, value: Tuple[Sequence[int], Vector3]) -> None:
+        self.domain.array_position[self.index] = self.domain.from_sector(*value)
+
+    @property
+    def position_absolute(self) -> Vector3:
+        """Return the Position of this Frame relative to the Primary of its
+            Domain. Far from the Primary, this is less precise than the
+            Position, which is relative to the Origin of the Domain. Without a
+            Domain, this is the same as the Position.
+        """
+        if self.domain is None:
+            return self.position
+        return Vector3(self.domain.array_position[self.index] + self.domain.origin)
+
+    @position_absolute.setter
+    def position_absolute(self, value: Vector3) -> None:
+        if self.domain is None:
+            self.position = value
+        else:
+            self.position = np.asarray(value, dtype=float) - self.domain.origin
+
+    def rebase(
+        self, domain: LocalSpace, offset: Vector3, offset_vel: Vector3
+    ) -> None:
+        """Move this Frame, and the Object registered to it, into a Slot of
+            another Domain. The Offsets are the Position and Velocity of the
+            Origin of the Arrays of the old Domain, as seen from those of the
+            new one.
+        """
+        old: LocalSpace = self.domain
+        obj = old.objects.get(self.index)
+        pos = old.array_position[self.index] + offset
+        vel = old.array_velocity[self.index] + offset_vel
+        heading = old.array_heading[self.index].copy()
+        rotate = old.array_rotate[self.index].copy()
+
+        if obj is not None:
+            old.unregister(obj)
+        old.release_index(self.index)
+
+        self.index = domain.add_frame(self)
+        for pointer in (self._position, self._rotation):
+            if isinstance(pointer, (position.Pointer, rotation.Pointer)):
+                pointer.domain = domain
+                pointer.index = self.index
+
+        domain.array_position[self.index] = pos
+        domain.array_velocity[self.index] = vel
+        domain.array_heading[self.index] = heading
+        domain.array_rotate[self.index] = rotate
+
+        if obj is not None:
+            domain.register(obj)
+
     def detach(self):
         self._position = self._position.clone()
         self._rotation = self._rotation.clone()
@@ -382,10 +789,12 @@ class Coordinates(object):
         return new
 
     def serialize(self):
+        # The Origin of the Domain moves whenever it is recentered, so record
+        #   the Position relative to the Primary instead.
         flat = {
             "type": type(self).__name__,
             "data": {
-                "pos": [round(p, 3) for p in self.position],
+                "pos": [round(p, 3) for p in self.position_absolute],
                 "vel": [round(p, 3) for p in self.velocity],
                 "aim": [round(p, 3) for p in self.heading.components],
                 "rot": [round(p, 3) for p in self.rotate.components],
@@ -396,4 +805,9 @@ class Coordinates(object):
 
     @classmethod
     def from_serial(cls, data, subs):
-        ...
+        new = cls(None, False)
+        new.set_posrot(
+            position.Virtual(Vector3(data["pos"]), Vector3(data["vel"])),
+            rotation.Virtual(quaternion(*data["aim"]), quaternion(*data["rot"])),
+        )
+        return new
@@ -1,12 +1,20 @@
 from abc import ABC, abstractmethod
 from typing import Tuple
 
+import numpy as np
 from quaternion import quaternion
 from vectormath import Vector3
 
 from .geometry import from_cylindrical, from_spherical, to_cylindrical, to_spherical
 
 
+def readonly(array: np.ndarray) -> np.ndarray:
+    """Return a View of an Array which cannot be written through."""
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
 class Position(ABC):
     __slots__ = ("domain", "unit")
 
@@ -0,0 +1,323 @@
+"""Module implementing the Forces which act upon Frames of Reference.
+
+Each Kernel adds the Acceleration it causes onto an Array parallel to the
+    Slots of one Domain, touching only the Slots which are marked as active.
+    Physical constants are taken from Astropy once, as plain floats, so that
+    the Kernels never handle Quantities.
+Uses Numba for JIT Compilation.
+"""
+
+from astropy import constants as const, units as u
+from numba import jit
+import numpy as np
+
+
+__all__ = [
+    "accelerate_barnes_hut",
+    "accelerate_mutual",
+    "accelerate_primary",
+    "BARNES_HUT_MIN",
+    "build_octree",
+    "G",
+    "gravity_step",
+    "mass_of",
+]
+
+
+# Gravitational Constant, in m³/(kg s²).
+G: float = const.G.to_value(u.m ** 3 / (u.kg * u.s ** 2))
+
+# Number of massive Bodies above which the "auto" Gravity Backend of a Domain
+#   uses a Barnes-Hut Octree rather than direct summation. Around this count,
+#   both take roughly the same time; See `engine.benchmark.gravity()`.
+BARNES_HUT_MIN = 2048
+
+
+def mass_of(node) -> float:
+    """Return the Mass of a Node in Kilograms, as a plain float."""
+    if node is None:
+        return 0.0
+
+    mass = getattr(node, "mass_q", None)
+    if mass is None:
+        mass = node.mass
+
+    if isinstance(mass, u.Quantity):
+        return mass.to_value(u.kg)
+    else:
+        return float(mass)
+
+
+@jit(nopython=True, nogil=True)
+def accelerate_primary(
+    position: np.ndarray, active: np.ndarray, gm: float, out: np.ndarray
+) -> None:
+    """Add the Acceleration toward a Primary at the Origin of the Domain, whose
+        Standard Gravitational Parameter (GM) is `gm`.
+    """
+    for i in range(position.shape[0]):
+        if not active[i]:
+            continue
+
+        r2 = position[i, 0] ** 2 + position[i, 1] ** 2 + position[i, 2] ** 2
+        if r2 == 0:
+            continue
+
+        scale = -gm / (r2 * np.sqrt(r2))
+        for k in range(3):
+            out[i, k] += scale * position[i, k]
+
+
+@jit(nopython=True, nogil=True)
+def accelerate_mutual(
+    position: np.ndarray,
+    mass: np.ndarray,
+    active: np.ndarray,
+    out: np.ndarray,
+    softening: float = 1.0,
+) -> None:
+    """Add the Accelerations of every massive Slot upon every other, by direct
+        summation. The Softening length keeps close passes finite.
+    """
+    n = position.shape[0]
+    sources = np.empty(n, np.int64)
+    n_sources = 0
+    for j in range(n):
+        if active[j] and mass[j] > 0:
+            sources[n_sources] = j
+            n_sources += 1
+
+    eps2 = softening * softening
+    for i in range(n):
+        if not active[i]:
+            continue
+
+        for s in range(n_sources):
+            j = sources[s]
+            if j == i:
+                continue
+
+            dx = position[j, 0] - position[i, 0]
+            dy = position[j, 1] - position[i, 1]
+            dz = position[j, 2] - position[i, 2]
+            r2 = dx * dx + dy * dy + dz * dz + eps2
+            scale = G * mass[j] / (r2 * np.sqrt(r2))
+
+            out[i, 0] += scale * dx
+            out[i, 1] += scale * dy
+            out[i, 2] += scale * dz
+
+
+@jit(nopython=True, nogil=True)
+def gravity_step(
+    position: np.ndarray, active: np.ndarray, gm: float, safety: float = 0.01
+) -> float:
+    """Return the largest step of time which is safe under the pull of the
+        Primary: a fraction (`safety`) of the shortest dynamical time,
+        sqrt(r³/GM), of any active Slot.
+    """
+    step = np.inf
+    if gm <= 0:
+        return step
+
+    for i in range(position.shape[0]):
+        if active[i]:
+            r2 = position[i, 0] ** 2 + position[i, 1] ** 2 + position[i, 2] ** 2
+            step = min(step, safety * np.sqrt(r2 * np.sqrt(r2) / gm))
+
+    return step
+
+
+# Deepest an Octree may subdivide. Bodies which still share a Cell at this
+#   depth are merged into a single Leaf.
+OCTREE_DEPTH = 48
+
+
+@jit(nopython=True, nogil=True)
+def _grow(array: np.ndarray, capacity: int, fill) -> np.ndarray:
+    out = np.full((capacity,) + array.shape[1:], fill, array.dtype)
+    out[: array.shape[0]] = array
+    return out
+
+
+@jit(nopython=True, nogil=True)
+def build_octree(position: np.ndarray, mass: np.ndarray, sources: np.ndarray):
+    """Build a Barnes-Hut Octree over the Slots listed in `sources`.
+
+    Return the Tree as parallel Arrays, indexed by Node, with Node 0 as the
+        Root: The width of each Cell, the total Mass and Center of Mass of the
+        Bodies within it, the Indices of its eight Children (-1 if none), and
+        the Slot of its Body if it is a Leaf holding exactly one (-1 if not).
+    """
+    n = sources.shape[0]
+    capacity = max(16, 2 * n)
+    width = np.zeros(capacity)
+    node_mass = np.zeros(capacity)
+    com = np.zeros((capacity, 3))
+    center = np.zeros((capacity, 3))
+    children = np.full((capacity, 8), -1, np.int64)
+    body = np.full(capacity, -1, np.int64)
+
+    order = sources.copy()
+    scratch = np.empty(n, np.int64)
+    octant = np.empty(n, np.int64)
+
+    lo = np.full(3, np.inf)
+    hi = np.full(3, -np.inf)
+    for s in range(n):
+        for k in range(3):
+            lo[k] = min(lo[k], position[order[s], k])
+            hi[k] = max(hi[k], position[order[s], k])
+
+    size = 0.0
+    for k in range(3):
+        center[0, k] = (lo[k] + hi[k]) / 2
+        size = max(size, hi[k] - lo[k])
+    width[0] = size * (1 + 1e-9) + 1e-9
+    n_nodes = 1
+
+    # Each entry: (Node, Start, End, Depth), over the range of `order` which
+    #   holds the Bodies within the Node.
+    stack = [(0, 0, n, 0)]
+    while stack:
+        node, start, end, depth = stack.pop()
+
+        m = 0.0
+        for s in range(start, end):
+            j = order[s]
+            m += mass[j]
+            for k in range(3):
+                com[node, k] += mass[j] * position[j, k]
+        node_mass[node] = m
+        for k in range(3):
+            com[node, k] /= m
+
+        if end - start == 1:
+            body[node] = order[start]
+            continue
+        elif depth >= OCTREE_DEPTH:
+            continue
+
+        # Sort the Bodies of this Node into its Octants.
+        counts = np.zeros(8, np.int64)
+        for s in range(start, end):
+            j = order[s]
+            code = 0
+            for k in range(3):
+                if position[j, k] > center[node, k]:
+                    code |= 1 << k
+            octant[s] = code
+            counts[code] += 1
+
+        offsets = np.zeros(8, np.int64)
+        for c in range(1, 8):
+            offsets[c] = offsets[c - 1] + counts[c - 1]
+        cursor = offsets.copy()
+        for s in range(start, end):
+            scratch[start + cursor[octant[s]]] = order[s]
+            cursor[octant[s]] += 1
+        order[start:end] = scratch[start:end]
+
+        for c in range(8):
+            if counts[c] == 0:
+                continue
+
+            if n_nodes == width.shape[0]:
+                capacity = 2 * n_nodes
+                width = _grow(width, capacity, 0.0)
+                node_mass = _grow(node_mass, capacity, 0.0)
+                com = _grow(com, capacity, 0.0)
+                center = _grow(center, capacity, 0.0)
+                children = _grow(children, capacity, -1)
+                body = _grow(body, capacity, -1)
+
+            child = n_nodes
+            n_nodes += 1
+            children[node, c] = child
+            width[child] = width[node] / 2
+            for k in range(3):
+                sign = 1 if c & (1 << k) else -1
+                center[child, k] = center[node, k] + sign * width[node] / 4
+
+            stack.append(
+                (child, start + offsets[c], start + offsets[c] + counts[c], depth + 1)
+            )
+
+    return (
+        width[:n_nodes],
+        node_mass[:n_nodes],
+        com[:n_nodes],
+        children[:n_nodes],
+        body[:n_nodes],
+    )
+
+
+@jit(nopython=True, nogil=True)
+def accelerate_barnes_hut(
+    position: np.ndarray,
+    mass: np.ndarray,
+    active: np.ndarray,
+    out: np.ndarray,
+    theta: float = 0.5,
+    softening: float = 1.0,
+) -> None:
+    """Add the Accelerations of every massive Slot upon every other, through a
+        Barnes-Hut Octree, in O(n log n).
+
+    Any Cell which appears narrower than the Opening Angle `theta` (its width
+        divided by its distance) is treated as a single Body at its Center of
+        Mass. With a `theta` of zero, this is equivalent to direct summation.
+    """
+    n = position.shape[0]
+    sources = np.empty(n, np.int64)
+    n_sources = 0
+    for j in range(n):
+        if active[j] and mass[j] > 0:
+            sources[n_sources] = j
+            n_sources += 1
+
+    if n_sources == 0:
+        return
+
+    width, node_mass, com, children, body = build_octree(
+        position, mass, sources[:n_sources]
+    )
+
+    eps2 = softening * softening
+    theta2 = theta * theta
+    stack = np.empty(8 * OCTREE_DEPTH + 8, np.int64)
+
+    for i in range(n):
+        if not active[i]:
+            continue
+
+        stack[0] = 0
+        top = 1
+        while top > 0:
+            top -= 1
+            node = stack[top]
+            if body[node] == i:
+                continue
+
+            dx = com[node, 0] - position[i, 0]
+            dy = com[node, 1] - position[i, 1]
+            dz = com[node, 2] - position[i, 2]
+            d2 = dx * dx + dy * dy + dz * dz
+
+            leaf = True
+            for c in range(8):
+                if children[node, c] >= 0:
+                    leaf = False
+                    break
+
+            if leaf or width[node] * width[node] < theta2 * d2:
+                r2 = d2 + eps2
+                scale = G * node_mass[node] / (r2 * np.sqrt(r2))
+                out[i, 0] += scale * dx
+                out[i, 1] += scale * dy
+                out[i, 2] += scale * dz
+            else:
+                for c in range(8):
+                    if children[node, c] >= 0:
+                        stack[top] = children[node, c]
+                        top += 1
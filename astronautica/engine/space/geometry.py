@@ -3,7 +3,7 @@ from typing import Tuple, Type, Union
 
 from numba import jit
 import numpy as np
-from quaternion import quaternion
+from quaternion import as_float_array, from_float_array, quaternion
 from vectormath import Vector3
 
 
@@ -26,10 +26,10 @@ NADIR = Vector3(0, 0, -1)
 ###===---
 
 
-@jit(nopython=True)
+@jit(nopython=True, nogil=True)
 def to_spherical(x: float, y: float, z: float) -> Tuple[float, float, float]:
     """Convert three-dimensional Cartesian Coordinates to Spherical."""
-    rho = np.sqrt(np.sum(np.square(np.array((x, y, z)))))
+    rho = np.sqrt(x * x + y * y + z * z)
     theta = 90 - degrees(np.arccos(z / rho)) if rho else 0
     phi = (
         0
@@ -39,7 +39,7 @@ def to_spherical(x: float, y: float, z: float) -> Tuple[float, float, float]:
     return rho, theta, phi
 
 
-@jit(nopython=True)
+@jit(nopython=True, nogil=True)
 def from_spherical(rho: float, theta: float, phi: float) -> Tuple[float, float, float]:
     """Convert three-dimensional Spherical Coordinates to Cartesian."""
     theta = np.pi / 2 - radians(theta)
@@ -50,15 +50,15 @@ def from_spherical(rho: float, theta: float, phi: float) -> Tuple[float, float,
     return x, y, z
 
 
-@jit(nopython=True)
+@jit(nopython=True, nogil=True)
 def to_cylindrical(x: float, y: float, z: float) -> Tuple[float, float, float]:
     """Convert three-dimensional Cartesian Coordinates to Cylindrical."""
-    rho = np.sqrt(np.sum(np.square(np.array((x, y)))))
-    phi = np.arctan2(y, x)
+    rho = np.sqrt(x * x + y * y)
+    phi = degrees(np.arctan2(y, x))
     return rho, phi, z
 
 
-@jit(nopython=True)
+@jit(nopython=True, nogil=True)
 def from_cylindrical(rho: float, phi: float, z: float) -> Tuple[float, float, float]:
     """Convert three-dimensional Cylindrical Coordinates to Cartesian."""
     phi_ = radians(phi)
@@ -67,6 +67,57 @@ def from_cylindrical(rho: float, phi: float, z: float) -> Tuple[float, float, fl
     return x, y, z
 
 
+###===---
+# ARRAY COORDINATE TRANSFORMATIONS
+# Each takes an (N, 3) Array of Coordinates, and returns a new (N, 3) Array of
+#   the same Coordinates in another System, without leaving compiled code.
+###===---
+
+
+@jit(nopython=True, nogil=True)
+def to_spherical_array(cartesian: np.ndarray) -> np.ndarray:
+    """Convert an Array of Cartesian Coordinates to Spherical."""
+    out = np.empty((cartesian.shape[0], 3))
+    for i in range(cartesian.shape[0]):
+        out[i, 0], out[i, 1], out[i, 2] = to_spherical(
+            cartesian[i, 0], cartesian[i, 1], cartesian[i, 2]
+        )
+    return out
+
+
+@jit(nopython=True, nogil=True)
+def from_spherical_array(spherical: np.ndarray) -> np.ndarray:
+    """Convert an Array of Spherical Coordinates to Cartesian."""
+    out = np.empty((spherical.shape[0], 3))
+    for i in range(spherical.shape[0]):
+        out[i, 0], out[i, 1], out[i, 2] = from_spherical(
+            spherical[i, 0], spherical[i, 1], spherical[i, 2]
+        )
+    return out
+
+
+@jit(nopython=True, nogil=True)
+def to_cylindrical_array(cartesian: np.ndarray) -> np.ndarray:
+    """Convert an Array of Cartesian Coordinates to Cylindrical."""
+    out = np.empty((cartesian.shape[0], 3))
+    for i in range(cartesian.shape[0]):
+        out[i, 0], out[i, 1], out[i, 2] = to_cylindrical(
+            cartesian[i, 0], cartesian[i, 1], cartesian[i, 2]
+        )
+    return out
+
+
+@jit(nopython=True, nogil=True)
+def from_cylindrical_array(cylindrical: np.ndarray) -> np.ndarray:
+    """Convert an Array of Cylindrical Coordinates to Cartesian."""
+    out = np.empty((cylindrical.shape[0], 3))
+    for i in range(cylindrical.shape[0]):
+        out[i, 0], out[i, 1], out[i, 2] = from_cylindrical(
+            cylindrical[i, 0], cylindrical[i, 1], cylindrical[i, 2]
+        )
+    return out
+
+
 ###===---
 # QUATERNION FUNCTIONS
 # Huge thanks to aeroeng15 for help with this.
@@ -74,38 +125,109 @@ def from_cylindrical(rho: float, phi: float, z: float) -> Tuple[float, float, fl
 ###===---
 
 
-@jit(nopython=True)
+@jit(nopython=True, nogil=True)
+def get_rotors(theta: np.ndarray, axis: np.ndarray) -> np.ndarray:
+    """Return an (N, 4) Array of Unit Quaternions which will rotate Headings by
+        each Theta, in radians, about each Axis of an (N, 3) Array.
+    """
+    out = np.empty((theta.shape[0], 4))
+    for i in range(theta.shape[0]):
+        norm = np.sqrt(axis[i, 0] ** 2 + axis[i, 1] ** 2 + axis[i, 2] ** 2)
+        half = theta[i] / 2
+        scale = np.sin(half) / norm if norm else 0.0
+
+        out[i, 0] = np.cos(half) if norm else 1.0
+        out[i, 1] = axis[i, 0] * scale
+        out[i, 2] = axis[i, 1] * scale
+        out[i, 3] = axis[i, 2] * scale
+    return out
+
+
+@jit(nopython=True, nogil=True)
+def break_rotors(rotors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Given an (N, 4) Array of Quaternions, break each into an angle, in
+        radians, and a Unit Vector Axis. A Rotor with no Vector part has an
+        angle of zero, and an Axis of zero.
+    """
+    theta = np.zeros(rotors.shape[0])
+    axis = np.zeros((rotors.shape[0], 3))
+    for i in range(rotors.shape[0]):
+        norm = np.sqrt(rotors[i, 1] ** 2 + rotors[i, 2] ** 2 + rotors[i, 3] ** 2)
+        if norm:
+            theta[i] = 2 * np.arctan2(norm, rotors[i, 0])
+            for k in range(3):
+                axis[i, k] = rotors[i, k + 1] / norm
+    return theta, axis
+
+
+@jit(nopython=True, nogil=True)
+def rotate_vectors(vectors: np.ndarray, rotors: np.ndarray) -> np.ndarray:
+    """Rotate each Vector of an (N, 3) Array around the matching Rotor of an
+        (N, 4) Array of Quaternions. Either Array may instead have a single row,
+        which is then applied to every row of the other. A Rotor of zero leaves
+        its Vector unchanged.
+
+    p' = q*p*(q^-1)
+    https://en.wikipedia.org/wiki/Quaternions_and_spatial_rotation
+    """
+    n = max(vectors.shape[0], rotors.shape[0])
+    out = np.empty((n, 3))
+    for i in range(n):
+        v = vectors[i if vectors.shape[0] > 1 else 0]
+        q = rotors[i if rotors.shape[0] > 1 else 0]
+
+        # Normalize, so that the inverse of the Rotor is its conjugate. A Rotor
+        #   of zero, such as a new Heading, is taken as the Identity.
+        norm = np.sqrt(q[0] ** 2 + q[1] ** 2 + q[2] ** 2 + q[3] ** 2)
+        if not norm:
+            out[i, 0] = v[0]
+            out[i, 1] = v[1]
+            out[i, 2] = v[2]
+            continue
+        w = q[0] / norm
+        x = q[1] / norm
+        y = q[2] / norm
+        z = q[3] / norm
+
+        # v' = v + w*t + (q.vec × t), where t = 2 * (q.vec × v).
+        tx = 2 * (y * v[2] - z * v[1])
+        ty = 2 * (z * v[0] - x * v[2])
+        tz = 2 * (x * v[1] - y * v[0])
+        out[i, 0] = v[0] + w * tx + (y * tz - z * ty)
+        out[i, 1] = v[1] + w * ty + (z * tx - x * tz)
+        out[i, 2] = v[2] + w * tz + (x * ty - y * tx)
+    return out
+
+
+@jit(nopython=True, nogil=True)
+def facings(rotors: np.ndarray) -> np.ndarray:
+    """Given an (N, 4) Array of Unit Quaternions, return the (N, 3) Array of
+        the Unit Vectors of their directions.
+    """
+    return rotate_vectors(np.array([[0.0, 1.0, 0.0]]), rotors)
+
+
 def get_rotor(theta: float, axis: Vector3) -> quaternion:
     """Return a Unit Quaternion which will rotate a Heading by Theta about Axis.
     """
-    q = quaternion(
-        np.cos(theta / 2), *(v * np.sin(theta / 2) for v in axis)
-    ).normalized()
-    return q
+    q = get_rotors(np.array([theta], float), np.array([axis], float))
+    return from_float_array(q[0])
 
 
-@jit(nopython=True)
 def break_rotor(q: quaternion) -> Tuple[float, Vector3]:
     """Given a Unit Quaternion, break it into an angle and a Vector3."""
-    theta, v = 2 * np.arccos(q.w), []
-    axis = Vector3(*v)
-    return theta, axis
+    theta, axis = break_rotors(as_float_array(q).reshape((1, 4)))
+    return theta[0], Vector3(axis[0])
 
 
-@jit(nopython=True)
 def rotate_vector(vector: Vector3, rotor: quaternion) -> Vector3:
-    """Rotate a Vector around a Rotor Quaternion.
-
-    p' = q*p*(q^-1)
-    https://en.wikipedia.org/wiki/Quaternions_and_spatial_rotation
-    """
-    p = quaternion(0, *vector)
-    qvec = rotor * p * rotor.inverse()
-    vector_out = Vector3(*[round(x, 3) for x in qvec.vec])
-    return vector_out
+    """Rotate a Vector around a Rotor Quaternion."""
+    out = rotate_vectors(
+        np.array([vector], float), as_float_array(rotor).reshape((1, 4))
+    )
+    return Vector3(out[0])
 
 
-@jit(nopython=True)
-def facing(quat) -> Vector3:
+def facing(quat: quaternion) -> Vector3:
     """Given a Unit Quaternion, return the Unit Vector of its direction."""
-    return rotate_vector(Vector3(0, 1, 0), quat)
+    return Vector3(facings(as_float_array(quat).reshape((1, 4)))[0])
@@ -0,0 +1,143 @@
+"""Module implementing the Sphere of Influence Hierarchy, which moves Frames of
+    Reference between Domains as they travel.
+
+A Domain may be anchored to a Frame within a parent Domain, usually that of
+    its Primary. Its Origin then follows that Frame, and its Sphere of
+    Influence is the region about the Origin within which the Primary, rather
+    than the Primary of the parent, dominates. Frames which leave a Sphere of
+    Influence are rebased into the parent Domain, and Frames which enter one
+    are rebased into the child, so that every Domain holds only the Frames
+    near its own Primary.
+Uses Numba for JIT Compilation.
+"""
+
+from typing import Dict, Iterable, List, TYPE_CHECKING
+
+from numba import jit
+import numpy as np
+
+if TYPE_CHECKING:
+    from . import LocalSpace
+
+
+__all__ = ["find_captures", "find_escapes", "migrate", "soi_radius"]
+
+
+def soi_radius(distance: float, gm: float, parent_gm: float) -> float:
+    """Return the Laplace radius of the Sphere of Influence of a Primary at a
+        given distance from the Primary of its parent.
+    """
+    if parent_gm <= 0:
+        return np.inf
+    return distance * (gm / parent_gm) ** 0.4
+
+
+@jit(nopython=True, nogil=True)
+def find_escapes(
+    position: np.ndarray, active: np.ndarray, centre: np.ndarray, radius: float
+) -> np.ndarray:
+    """Return the active Slots whose Positions lie farther than `radius` from
+        `centre`.
+    """
+    out = np.empty(position.shape[0], np.int64)
+    n = 0
+    r2 = radius * radius
+
+    for i in range(position.shape[0]):
+        if active[i]:
+            d2 = 0.0
+            for k in range(3):
+                d2 += (position[i, k] - centre[k]) ** 2
+            if d2 > r2:
+                out[n] = i
+                n += 1
+
+    return out[:n]
+
+
+@jit(nopython=True, nogil=True)
+def find_captures(
+    position: np.ndarray,
+    active: np.ndarray,
+    centre: np.ndarray,
+    radius: float,
+    exclude: int,
+) -> np.ndarray:
+    """Return the active Slots, other than `exclude`, whose Positions lie within
+        `radius` of `centre`.
+    """
+    out = np.empty(position.shape[0], np.int64)
+    n = 0
+    r2 = radius * radius
+
+    for i in range(position.shape[0]):
+        if active[i] and i != exclude:
+            d2 = 0.0
+            for k in range(3):
+                d2 += (position[i, k] - centre[k]) ** 2
+            if d2 < r2:
+                out[n] = i
+                n += 1
+
+    return out[:n]
+
+
+def migrate(domains: Iterable["LocalSpace"]) -> int:
+    """Rebase every Frame which has left the Sphere of Influence of its Domain
+        into the parent Domain, and then every Frame which has entered the
+        Sphere of Influence of a child Domain into the child. Return the number
+        of Frames moved.
+    """
+    domains = list(domains)
+    children: Dict[int, List["LocalSpace"]] = {}
+    for local in domains:
+        parent = local.parent
+        if parent is not None:
+            children.setdefault(parent.index, []).append(local)
+
+    if not children:
+        return 0
+
+    moved = 0
+
+    # Escapes: Up one level, adding the Origin of the child as seen from the
+    #   parent. The Primary of the child is at its Anchor, which is offset from
+    #   the Origin of its Arrays by its Sector.
+    for local in domains:
+        parent = local.parent
+        if parent is None or not local.used:
+            continue
+
+        active = local.space.array_active[local.index]
+        slots = find_escapes(
+            local.array_position, active, -local.origin, local.soi_radius
+        )
+        if slots.size:
+            origin = local.anchor
+            pos = origin.position + local.origin
+            for frame in local.frames_at(slots):
+                frame.rebase(parent, pos, origin.velocity)
+                moved += 1
+
+    # Captures: Down one level, subtracting the Origin of the child.
+    for local in domains:
+        if local.index not in children or not local.used:
+            continue
+
+        active = local.space.array_active[local.index]
+        for child in children[local.index]:
+            origin = child.anchor
+            slots = find_captures(
+                local.array_position,
+                active,
+                local.array_position[origin.index],
+                child.soi_radius,
+                origin.index,
+            )
+            if slots.size:
+                pos = origin.position + child.origin
+                for frame in local.frames_at(slots):
+                    frame.rebase(child, -pos, -origin.velocity)
+                    moved += 1
+
+    return moved
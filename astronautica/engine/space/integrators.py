@@ -0,0 +1,97 @@
+"""Module implementing the Integrators which advance the Positions and
+    Velocities of a Domain through a step of Time.
+
+Every Integrator works in place on the Arrays of one Domain, touching only the
+    Slots which are marked as active. Accelerations are supplied by a callable
+    which takes no arguments and reads the current Positions of the Domain, so
+    that an Integrator may sample them as often as its scheme requires.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional, Type
+
+import numpy as np
+
+from .kinematics import advance_positions, advance_velocities
+
+
+__all__ = ["Acceleration", "Euler", "Integrator", "INTEGRATORS", "Verlet"]
+
+
+Acceleration = Callable[[], np.ndarray]
+
+
+class Integrator(ABC):
+    """ABC for a numerical scheme advancing one Domain through Time."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def step(
+        self,
+        position: np.ndarray,
+        velocity: np.ndarray,
+        active: np.ndarray,
+        time: float,
+        acceleration: Optional[Acceleration] = None,
+    ) -> None:
+        """Advance the active Positions and Velocities by `time` seconds. If
+            there is no Acceleration, every Velocity is constant.
+        """
+        ...
+
+
+class Euler(Integrator):
+    """Semi-implicit Euler: Apply the Acceleration at the start of the step to
+        the Velocities, and then move along the new Velocities. First order;
+        Cheapest, but Orbits gain or lose energy unless steps are small.
+    """
+
+    __slots__ = ()
+
+    def step(
+        self,
+        position: np.ndarray,
+        velocity: np.ndarray,
+        active: np.ndarray,
+        time: float,
+        acceleration: Optional[Acceleration] = None,
+    ) -> None:
+        if acceleration is not None:
+            advance_velocities(velocity, acceleration(), active, time)
+
+        advance_positions(position, velocity, active, time)
+
+
+class Verlet(Integrator):
+    """Velocity Verlet, or "Kick-Drift-Kick" Leapfrog: Apply half of the
+        Acceleration at the start of the step, move along the new Velocities,
+        and then apply half of the Acceleration at the end of the step.
+
+    Second order and symplectic, so the energy of an Orbit stays bounded over
+        any number of steps, rather than drifting. Costs two evaluations of the
+        Acceleration per step.
+    """
+
+    __slots__ = ()
+
+    def step(
+        self,
+        position: np.ndarray,
+        velocity: np.ndarray,
+        active: np.ndarray,
+        time: float,
+        acceleration: Optional[Acceleration] = None,
+    ) -> None:
+        if acceleration is None:
+            advance_positions(position, velocity, active, time)
+            return
+
+        half = time / 2
+        advance_velocities(velocity, acceleration(), active, half)
+        advance_positions(position, velocity, active, time)
+        advance_velocities(velocity, acceleration(), active, half)
+
+
+# Integrators by the names used in configuration.
+INTEGRATORS: Dict[str, Type[Integrator]] = {"euler": Euler, "verlet": Verlet}
@@ -0,0 +1,76 @@
+"""Module implementing the Kernels which move Frames of Reference through
+    Space over Time.
+
+Every Kernel operates in place on the Arrays of one Domain, and touches only
+    the Slots which are marked as active.
+Uses Numba for JIT Compilation.
+"""
+
+from numba import jit
+import numpy as np
+
+
+__all__ = ["advance_headings", "advance_positions", "advance_velocities"]
+
+
+@jit(nopython=True, nogil=True)
+def advance_positions(
+    position: np.ndarray, velocity: np.ndarray, active: np.ndarray, time: float
+) -> None:
+    """Move every active Position along its Velocity for `time` seconds."""
+    for i in range(position.shape[0]):
+        if active[i]:
+            for k in range(3):
+                position[i, k] += velocity[i, k] * time
+
+
+@jit(nopython=True, nogil=True)
+def advance_velocities(
+    velocity: np.ndarray, acceleration: np.ndarray, active: np.ndarray, time: float
+) -> None:
+    """Change every active Velocity by its Acceleration for `time` seconds."""
+    for i in range(velocity.shape[0]):
+        if active[i]:
+            for k in range(3):
+                velocity[i, k] += acceleration[i, k] * time
+
+
+@jit(nopython=True, nogil=True)
+def advance_headings(
+    heading: np.ndarray, rotate: np.ndarray, active: np.ndarray, time: float
+) -> None:
+    """Turn every active Heading by its Rotation for `time` seconds.
+
+    A Rotation is a Unit Quaternion (cos θ/2, sin θ/2 * axis) describing the
+        turn made over one second. Over `time` seconds, the turn is exactly
+        (cos tθ/2, sin tθ/2 * axis), which is applied to the Heading from the
+        left. Rotations with no Vector part are the identity, and are skipped.
+    """
+    for i in range(heading.shape[0]):
+        if not active[i]:
+            continue
+
+        x = rotate[i, 1]
+        y = rotate[i, 2]
+        z = rotate[i, 3]
+        sin_half = np.sqrt(x * x + y * y + z * z)
+        if sin_half == 0:
+            continue
+
+        # Scale the half-angle by time, keeping the axis.
+        half = np.arctan2(sin_half, rotate[i, 0]) * time
+        rw = np.cos(half)
+        scale = np.sin(half) / sin_half
+        rx = x * scale
+        ry = y * scale
+        rz = z * scale
+
+        hw = heading[i, 0]
+        hx = heading[i, 1]
+        hy = heading[i, 2]
+        hz = heading[i, 3]
+
+        heading[i, 0] = rw * hw - rx * hx - ry * hy - rz * hz
+        heading[i, 1] = rw * hx + rx * hw + ry * hz - rz * hy
+        heading[i, 2] = rw * hy - rx * hz + ry * hw + rz * hx
+        heading[i, 3] = rw * hz + rx * hy - ry * hx + rz * hw
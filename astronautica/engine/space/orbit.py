@@ -1,19 +1,193 @@
-from typing import Tuple
+"""Orbit Module: Dedicated to Frames of Reference which follow closed-form
+    Keplerian Orbits, rather than being integrated step by step.
+
+The state of an Orbit is a pure function of Time, so it costs nothing until it
+    is sampled, and may be sampled at any Time. Many Orbits may be propagated
+    together, as Arrays of their Elements.
+Uses Numba for JIT Compilation.
+"""
+
+from math import radians
+from typing import Sequence, Tuple
 
 from astropy import units as u
+from numba import jit
+import numpy as np
 from vectormath import Vector3
 
-from engine.space import Position, Clock
+from .base import Position
+from ..world.base import Clock
+
+
+__all__ = [
+    "eccentric_anomaly",
+    "kepler_state",
+    "lagrange_points",
+    "Lagrangian",
+    "Orbit",
+    "propagate",
+]
+
+
+@jit(nopython=True, nogil=True)
+def eccentric_anomaly(
+    mean: np.ndarray, ecc: np.ndarray, tolerance: float = 1e-12, iterations: int = 32
+) -> np.ndarray:
+    """Solve Kepler's Equation, M = E - e sin E, for the Eccentric Anomaly E of
+        every Orbit, by Newton's Method.
+    """
+    out = np.empty_like(mean)
+
+    for i in range(mean.shape[0]):
+        m = mean[i]
+        e = ecc[i]
+        # Starting from π converges reliably for highly eccentric Orbits.
+        E = m if e < 0.8 else np.pi
+
+        for _ in range(iterations):
+            delta = (E - e * np.sin(E) - m) / (1 - e * np.cos(E))
+            E -= delta
+            if abs(delta) < tolerance:
+                break
+
+        out[i] = E
+
+    return out
+
+
+@jit(nopython=True, nogil=True)
+def kepler_state(
+    semimajor: np.ndarray,
+    ecc: np.ndarray,
+    incline: np.ndarray,
+    ascending: np.ndarray,
+    periapsis: np.ndarray,
+    mean_epoch: np.ndarray,
+    mu: np.ndarray,
+    time: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the Positions and Velocities, relative to their Primaries, of N
+        elliptical Orbits at a given Time, each shaped (N, 3).
+
+    Every Element is an Array of N values: Semi-major Axis, Eccentricity,
+        Inclination, Longitude of the Ascending Node, Argument of Periapsis,
+        and Mean Anomaly at Time zero, with angles in radians. `mu` is the
+        Standard Gravitational Parameter of each Primary, in units consistent
+        with the Semi-major Axis and seconds.
+    """
+    n = semimajor.shape[0]
+    motion = np.sqrt(mu / semimajor ** 3)
+    mean = np.remainder(mean_epoch + motion * time, 2 * np.pi)
+    E = eccentric_anomaly(mean, ecc)
+
+    pos = np.empty((n, 3))
+    vel = np.empty((n, 3))
+
+    for i in range(n):
+        a = semimajor[i]
+        e = ecc[i]
+        cos_e = np.cos(E[i])
+        sin_e = np.sin(E[i])
+        root = np.sqrt(1 - e * e)
+
+        # Position and Velocity within the plane of the Orbit, with X toward
+        #   Periapsis.
+        x = a * (cos_e - e)
+        y = a * root * sin_e
+        rate = a * motion[i] / (1 - e * cos_e)
+        vx = -rate * sin_e
+        vy = rate * root * cos_e
+
+        cos_o = np.cos(ascending[i])
+        sin_o = np.sin(ascending[i])
+        cos_w = np.cos(periapsis[i])
+        sin_w = np.sin(periapsis[i])
+        cos_i = np.cos(incline[i])
+        sin_i = np.sin(incline[i])
+
+        # Unit Vectors toward Periapsis (P) and ninety degrees ahead of it (Q).
+        px = cos_o * cos_w - sin_o * sin_w * cos_i
+        py = sin_o * cos_w + cos_o * sin_w * cos_i
+        pz = sin_w * sin_i
+        qx = -cos_o * sin_w - sin_o * cos_w * cos_i
+        qy = -sin_o * sin_w + cos_o * cos_w * cos_i
+        qz = cos_w * sin_i
+
+        pos[i, 0] = x * px + y * qx
+        pos[i, 1] = x * py + y * qy
+        pos[i, 2] = x * pz + y * qz
+        vel[i, 0] = vx * px + vy * qx
+        vel[i, 1] = vx * py + vy * qy
+        vel[i, 2] = vx * pz + vy * qz
+
+    return pos, vel
+
+
+def propagate(
+    orbits: Sequence["Orbit"], time: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the Positions and Velocities of many Orbits, relative to their
+        Primaries, at a given Time, in one pass.
+    """
+    elements = np.array([o.elements for o in orbits], dtype=float).reshape((-1, 7))
+    return kepler_state(*elements.T.copy(), time)
+
+
+def lagrange_points(
+    position: np.ndarray, velocity: np.ndarray, ratio: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the Positions and Velocities of the five Lagrangian Points of N
+        Satellites, relative to their Primaries, each shaped (N, 5, 3).
+
+    `position` and `velocity` are the (N, 3) States of the Satellites relative
+        to their Primaries, and `ratio` is the Mass of each Satellite divided
+        by that of its Primary. L1 through L3 lie on the line through the
+        Primary and the Satellite, and L4 and L5 lead and trail the Satellite
+        by sixty degrees; All five corotate with it.
+    """
+    ratio = np.asarray(ratio, dtype=float).reshape((-1, 1))
+    dist_sq = np.einsum("ij,ij->i", position, position)[:, None]
+    momentum = np.cross(position, velocity)
+    omega = momentum / dist_sq
+    normal = momentum / np.linalg.norm(momentum, axis=1, keepdims=True)
+
+    hill = np.cbrt(ratio / 3)
+    ahead = np.cross(normal, position)
+    cos60 = 0.5
+    sin60 = np.sqrt(3) / 2
+
+    points = np.empty((position.shape[0], 5, 3))
+    points[:, 0] = position * (1 - hill)
+    points[:, 1] = position * (1 + hill)
+    points[:, 2] = position * -(1 + 5 * ratio / 12)
+    points[:, 3] = position * cos60 + ahead * sin60
+    points[:, 4] = position * cos60 - ahead * sin60
+
+    return points, np.cross(omega[:, None, :], points)
 
 
 class Orbit(Position):
     """A Relative Frame of Reference which is based on a Primary, whose real
         position is a function of Time.
-    """
 
-    # TODO
+    Angles are given in degrees. The Radius is the Semi-major Axis, measured in
+        the Unit of the Orbit. If the Standard Gravitational Parameter (`mu`,
+        in m³/s²) is not given, it is taken from the Domain of the Primary.
+        Only elliptical Orbits are supported, so the Eccentricity must be
+        below one.
+    """
 
-    __slots__ = ("offset", "primary", "radius", "time")
+    __slots__ = (
+        "ascending",
+        "eccentricity",
+        "inclination",
+        "mu",
+        "offset",
+        "periapsis",
+        "primary",
+        "radius",
+        "time",
+    )
 
     def __init__(
         self,
@@ -23,80 +197,122 @@ class Orbit(Position):
         unit: u.Unit = u.meter,
         *,
         offset: float = 0,
+        eccentricity: float = 0,
+        inclination: float = 0,
+        ascending: float = 0,
+        periapsis: float = 0,
+        mu: float = None,
     ):
+        if not 0 <= eccentricity < 1:
+            raise ValueError("Orbit Eccentricity must be at least 0 and below 1.")
+
         self.primary = primary
         self.radius = radius
         self.time = time
 
+        # Mean Anomaly at Time zero.
         self.offset = offset
+        self.eccentricity = eccentricity
+        self.inclination = inclination
+        self.ascending = ascending
+        self.periapsis = periapsis
 
         self.domain = self.primary.domain
         self.unit = unit
 
-    @property
-    def position(self) -> Vector3:
-        pass
+        if mu is None:
+            mu = getattr(self.domain, "gm", 0.0)
+        self.mu = mu
 
     @property
-    def velocity(self) -> Vector3:
-        pass
+    def elements(self) -> Tuple[float, float, float, float, float, float, float]:
+        """Return the Elements of this Orbit in the form taken by
+            `kepler_state()`: Lengths in the Unit of the Orbit, and angles in
+            radians.
+        """
+        return (
+            self.radius,
+            self.eccentricity,
+            radians(self.inclination),
+            radians(self.ascending),
+            radians(self.periapsis),
+            radians(self.offset),
+            self.mu * u.m.to(self.unit) ** 3,
+        )
 
     @property
-    def position_pol(self) -> Tuple[float, float, float]:
-        pass
+    def period(self) -> float:
+        """Return the time taken to complete one Orbit, in seconds."""
+        mu = self.elements[6]
+        return 2 * np.pi * np.sqrt(self.radius ** 3 / mu) if mu else np.inf
 
-    @property
-    def velocity_pol(self) -> Tuple[float, float, float]:
-        pass
+    def state(self, time: float = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the Position and Velocity of this Orbit, relative to its
+            Primary, at a given Time, or now.
+        """
+        pos, vel = propagate((self,), self.time() if time is None else time)
+        return pos[0], vel[0]
 
     @property
-    def position_cyl(self) -> Tuple[float, float, float]:
-        pass
+    def position(self) -> Vector3:
+        return Vector3(self.primary.position + self.state()[0])
 
     @property
-    def velocity_cyl(self) -> Tuple[float, float, float]:
-        pass
+    def velocity(self) -> Vector3:
+        return Vector3(self.primary.velocity + self.state()[1])
+
+    def clone(self) -> "Orbit":
+        return Orbit(
+            self.primary,
+            self.radius,
+            self.time,
+            self.unit,
+            offset=self.offset,
+            eccentricity=self.eccentricity,
+            inclination=self.inclination,
+            ascending=self.ascending,
+            periapsis=self.periapsis,
+            mu=self.mu,
+        )
 
 
 class Lagrangian(Position):
     """A Relative Frame of Reference which is based on an Orbit; The five
         Lagrangian Points are the points relative to an Orbiting Body at which
         a Body can maintain a stable secondary Orbit.
+
+    The Ratio is the Mass of the Leader divided by that of its Primary, in
+        the same Units, as given by `System.lagrange_points()`. It must be
+        positive; Without it, L1 and L2 would lie on the Leader itself.
     """
 
-    # TODO: Return Real values relative to Leader as appropriate for Point.
+    __slots__ = ("leader", "point", "ratio")
+
+    def __init__(self, leader: Orbit, point: int, ratio: float):
+        if not 1 <= point <= 5:
+            raise ValueError("Lagrangian Point must be between 1 and 5.")
+        if ratio <= 0:
+            raise ValueError("Lagrangian Mass Ratio must be positive.")
 
-    def __init__(self, leader: Orbit, point: int):
         self.leader: Orbit = leader
         self.point: int = point
-        self.real: Orbit = Orbit(
-            self.leader.primary,
-            self.leader.radius,
-            self.leader.time,
-            self.leader.unit,
-            offset=self.leader.offset,
-        )
-
-    @property
-    def position(self) -> Vector3:
-        return self.real.position
+        self.ratio: float = ratio
 
-    @property
-    def velocity(self) -> Vector3:
-        return self.real.velocity
+        self.domain = self.leader.domain
+        self.unit = self.leader.unit
 
-    @property
-    def position_pol(self) -> Tuple[float, float, float]:
-        return self.real.position_pol
+    def state(self, time: float = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the Position and Velocity of this Point, relative to the
+            Primary of its Leader, at a given Time, or now.
+        """
+        pos, vel = self.leader.state(time)
+        points, rates = lagrange_points(pos[None], vel[None], self.ratio)
+        return points[0, self.point - 1], rates[0, self.point - 1]
 
     @property
-    def velocity_pol(self) -> Tuple[float, float, float]:
-        return self.real.velocity_pol
-
-    @property
-    def position_cyl(self) -> Tuple[float, float, float]:
-        return self.real.position_cyl
+    def position(self) -> Vector3:
+        return Vector3(self.leader.primary.position + self.state()[0])
 
     @property
-    def velocity_cyl(self) -> Tuple[float, float, float]:
-        return self.real.velocity_cyl
+    def velocity(self) -> Vector3:
+        return Vector3(self.leader.primary.velocity + self.state()[1])
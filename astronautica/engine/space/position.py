@@ -4,7 +4,7 @@ from astropy import units as u
 import numpy as np
 from vectormath import Vector3
 
-from .base import Position
+from .base import Position, readonly
 
 
 class Pointer(Position):
@@ -45,6 +45,20 @@ class Pointer(Position):
         """
         self.domain.array_velocity[self.index] = v
 
+    @property
+    def position_view(self) -> np.ndarray:
+        """Return a read-only View of the Position assigned to this FoR. It is
+            not copied, so it follows later changes until the Space grows.
+        """
+        return readonly(self.domain.array_position[self.index])
+
+    @property
+    def velocity_view(self) -> np.ndarray:
+        """Return a read-only View of the Velocity assigned to this FoR. It is
+            not copied, so it follows later changes until the Space grows.
+        """
+        return readonly(self.domain.array_velocity[self.index])
+
     def clone(self: Position) -> "Virtual":
         return Virtual(self.position, self.velocity, unit=self.unit)
 
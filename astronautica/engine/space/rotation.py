@@ -2,9 +2,20 @@
     Space.
 """
 
-from quaternion import quaternion
+import numpy as np
+from quaternion import as_float_array, from_float_array, quaternion
 
-from .base import Rotation
+from .base import readonly, Rotation
+
+
+def as_components(value) -> np.ndarray:
+    """Return the four components (w, x, y, z) of a Quaternion, which may also
+        be given as any Sequence of four Numbers.
+    """
+    if isinstance(value, quaternion):
+        return as_float_array(value)
+    else:
+        return np.asarray(value, dtype=float)
 
 
 class Pointer(Rotation):
@@ -19,19 +30,33 @@ class Pointer(Rotation):
 
     @property
     def heading(self) -> quaternion:
-        return self.domain.quat_heading[self.index]
+        return from_float_array(self.domain.array_heading[self.index])
 
     @heading.setter
     def heading(self, value: quaternion) -> None:
-        self.domain.quat_heading[self.index] = value
+        self.domain.array_heading[self.index] = as_components(value)
 
     @property
     def rotate(self) -> quaternion:
-        return self.domain.quat_rotate[self.index]
+        return from_float_array(self.domain.array_rotate[self.index])
 
     @rotate.setter
     def rotate(self, value: quaternion) -> None:
-        self.domain.quat_rotate[self.index] = value
+        self.domain.array_rotate[self.index] = as_components(value)
+
+    @property
+    def heading_view(self) -> np.ndarray:
+        """Return a read-only View of the Heading assigned to this FoR, as the
+            four components (w, x, y, z) of its Quaternion. It is not copied.
+        """
+        return readonly(self.domain.array_heading[self.index])
+
+    @property
+    def rotate_view(self) -> np.ndarray:
+        """Return a read-only View of the Rotation assigned to this FoR, as the
+            four components (w, x, y, z) of its Quaternion. It is not copied.
+        """
+        return readonly(self.domain.array_rotate[self.index])
 
     def clone(self: Rotation) -> "Virtual":
         return Virtual(self.heading, self.rotate)
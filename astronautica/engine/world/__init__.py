@@ -1,29 +1,46 @@
+from asyncio import Future, shield, wrap_future
+from collections import OrderedDict
+from concurrent.futures import Future as Job, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from secrets import choice
-from typing import Dict, Optional, Tuple, Union
+from secrets import randbelow
+from typing import Dict, List, Optional, Set, Tuple, Union
 from uuid import UUID, uuid4
 
 import numpy as np
-from numpy.linalg import norm
+from scipy.spatial import cKDTree
 from yaml import safe_dump, safe_load
 
 from ..rendering import render_galaxy
 from ..serial import deserialize
 from .base import Clock
+from .catalogue import (
+    id_key,
+    id_keys,
+    new_ids,
+    read_catalogue,
+    read_text,
+    write_catalogue,
+    write_text,
+)
 from .generation import generate_galaxy, generate_system
 from .gravity import MultiSystem, System
 from config import cfg
 from util.storage import PersistentDict
 
 
-DELIM = "|"
-LINE = (DELIM.join((*(["{: = 23}"] * 3), "{}")) + "\n").format
+# One Thread Pool is shared by every Galaxy, so that replacing the Galaxy does
+#   not leave the Threads of the old one behind.
+PREFETCHER = ThreadPoolExecutor(
+    cfg.get("game/prefetch_workers", 2), thread_name_prefix="prefetch"
+)
 
 
 class SystemHandler(object):
     __slots__ = (
         "data",
         "path",
+        "pins",
         "system",
         "uuid",
     )
@@ -34,12 +51,25 @@ class SystemHandler(object):
 
         self.data = PersistentDict(self.path, fmt="json")
         self.uuid = dat[3]
+        # Number of Players or active Objects holding this System in memory.
+        self.pins: int = 0
 
         if _load:
             self.system = deserialize(self.data)
         else:
             self.system = generate_system(self.data)
 
+    @property
+    def pinned(self) -> bool:
+        return self.pins > 0
+
+    def pin(self) -> None:
+        """Keep this System loaded until it is unpinned as many times."""
+        self.pins += 1
+
+    def unpin(self) -> None:
+        self.pins = max(0, self.pins - 1)
+
     def serialize(self):
         return dict(type=type(self).__name__)
 
@@ -49,12 +79,38 @@ class SystemHandler(object):
 
 
 class Galaxy(object):
+    """A Galaxy of Stars, each of which may be the center of a System.
+
+    The Positions of the Stars are kept in one contiguous (N, 3) Array, and the
+        UUIDs, split into their 64-bit halves, in a parallel (N, 2) Array.
+        Stars are found by UUID through an Index of rows, and by Position
+        through a KD-Tree, both built on first use.
+
+    Loaded Systems are kept in order of use. Once there are more than the
+        Capacity, the least recently used Systems which are not pinned are
+        unloaded, and synced to disk by a Thread Pool. Systems may also be loaded in the
+        background, by a Thread Pool, so that the Event Loop never waits on
+        the disk or on generation. Systems which are only prefetched, and not
+        requested, are kept as the least recently used, and may fill at most
+        half of the Capacity.
+    """
+
     __slots__ = (
+        "_index",
+        "_tree",
+        "capacity",
+        "evictions",
         "gdir",
         "gid",
+        "hits",
+        "ids",
         "loaded",
+        "misses",
         "obj",
+        "pending",
+        "requested",
         "stars",
+        "syncing",
     )
 
     @classmethod
@@ -63,6 +119,7 @@ class Galaxy(object):
 
         if path.is_dir():
             p_data = path / cfg["data/meta", "meta.yml"]
+            p_cat = path / cfg["data/catalogue", "STARS.npy"]
             p_stars = path / cfg["data/stars", "STARS"]
         else:
             raise NotADirectoryError(path)
@@ -70,31 +127,51 @@ class Galaxy(object):
         with p_data.open("r") as f:
             data = safe_load(f)
 
-        def stream():
-            with p_stars.open("r") as file:
-                for line in file:
-                    if line.count(DELIM) == 3:
-                        x, y, z, h = line.strip("\n").replace(" ", "").split(DELIM)
-                        yield float(x), float(y), float(z), UUID(hex=h).int
+        # Prefer the binary Catalogue, but fall back to importing the text
+        #   format, if that is all there is.
+        if p_cat.exists():
+            cat = read_catalogue(p_cat)
+            pos, ids = cat["pos"], cat["id"]
+        else:
+            pos, ids = read_text(p_stars)
 
-        stars = np.array(list(stream()))
-        return cls(stars, path, UUID(hex=data["uuid"]))
+        return cls(np.ascontiguousarray(pos), path, UUID(hex=data["uuid"]), ids)
 
     @classmethod
     def generate(cls, *a, name: str = None, **kw) -> "Galaxy":
         uuid = uuid4()
 
         stars = np.concatenate(generate_galaxy(*a, **kw))
-        stars = np.concatenate((stars, [[uuid4().int] for _ in stars]), 1)
+        ids = new_ids(len(stars))
 
-        return cls(stars, Path(cfg["data/directory"], "world", name or uuid.hex), uuid)
+        return cls(
+            stars, Path(cfg["data/directory"], "world", name or uuid.hex), uuid, ids
+        )
 
-    def __init__(self, stars: np.ndarray, gdir: Path, gid: UUID):
-        self.stars = stars
+    def __init__(self, stars: np.ndarray, gdir: Path, gid: UUID, ids: np.ndarray):
+        self.stars: np.ndarray = stars
+        self.ids: np.ndarray = ids
         self.gdir = gdir
         self.gid = gid
-
-        self.loaded: Dict[int, SystemHandler] = {}
+        self._index: Optional[Dict[bytes, int]] = None
+        self._tree: Optional[cKDTree] = None
+
+        self.loaded: Dict[int, SystemHandler] = OrderedDict()
+        self.capacity: int = cfg.get("game/systems_loaded", 256)
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+        # Background loads which have not yet finished, by UUID Integer. Every
+        #   request for a System in this Dict waits on the same Job.
+        self.pending: Dict[int, Job] = {}
+        # UUID Integers of pending loads which have been requested, rather
+        #   than only prefetched.
+        self.requested: Set[int] = set()
+        # Evicted Systems which are still being synced, with the Jobs of their
+        #   syncs, by UUID Integer. A System in this Dict is taken back, rather
+        #   than read from a file which is not yet written.
+        self.syncing: Dict[int, Tuple[SystemHandler, Job]] = {}
         self.obj = PersistentDict(
             self.gdir / cfg["data/obj", "objects.json"], fmt="json"
         )
@@ -104,32 +181,140 @@ class Galaxy(object):
             if not self.gdir.is_dir():
                 raise NotADirectoryError(self.gdir)
         else:
-            self.gdir.mkdir()
+            self.gdir.mkdir(exist_ok=True)
+
+    def _system_file(self, uuid: UUID) -> Tuple[Path, Tuple[float, float, float, int]]:
+        """Return the Path of the file of a System, and the data of its Star."""
+        dat = self.system_by_uuid(uuid)
+        if not dat:
+            raise FileNotFoundError(f"System {uuid.hex!r} not found in Galaxy.")
+
+        self.ensure()
+        systems = self.gdir / "systems"
+        systems.mkdir(exist_ok=True)
+        return (systems / uuid.hex).with_suffix(".json"), dat
+
+    def _load(self, uuid: UUID) -> SystemHandler:
+        return SystemHandler(*self._system_file(uuid))
+
+    def _insert(
+        self, uuid_i: int, system: SystemHandler, recent: bool = True
+    ) -> SystemHandler:
+        """Add a newly loaded System, unless another copy was loaded first.
+            Return whichever copy is kept. If the System is not recent, it is
+            added as the least recently used, to be evicted first.
+        """
+        if uuid_i in self.loaded:
+            return self.loaded[uuid_i]
+
+        # Make room first, so that the new System is never the one evicted.
+        self.evict(1)
+        self.loaded[uuid_i] = system
+        if not recent:
+            self.loaded.move_to_end(uuid_i, last=False)
+        return system
 
     def get_system(self, uuid: UUID) -> SystemHandler:
         """Retrieve a Star System by its UUID. If the System does not exist,
             procedurally generate it on the fly.
         """
-        uuid_h = uuid.hex
         uuid_i = uuid.int
-        self.ensure()
 
         if uuid_i in self.loaded:
+            self.hits += 1
+            self.loaded.move_to_end(uuid_i)
             return self.loaded[uuid_i]
 
-        dat = self.system_by_uuid(uuid)
+        self.misses += 1
+        if uuid_i in self.syncing:
+            system, job = self.syncing[uuid_i]
+            job.result()
+            return self._insert(uuid_i, system)
 
-        if dat:
-            systems = self.gdir / "systems"
-            systems.mkdir(exist_ok=True)
-            fp = (systems / uuid_h).with_suffix(".json")
+        job = self.pending.pop(uuid_i, None)
+        if job is not None:
+            # Wait for the background load, rather than load the file twice.
+            self.requested.discard(uuid_i)
+            return self._insert(uuid_i, job.result())
 
-            system = SystemHandler(fp, dat)
+        return self._insert(uuid_i, self._load(uuid))
 
-            self.loaded[uuid_i] = system
-            return system
-        else:
-            raise FileNotFoundError(f"System {uuid_h!r} not found in Galaxy.")
+    async def get_system_async(self, uuid: UUID) -> SystemHandler:
+        """Retrieve a Star System by its UUID, loading or generating it in the
+            background if needed. If it is already being loaded, wait for that
+            load rather than starting another.
+        """
+        uuid_i = uuid.int
+
+        if uuid_i in self.loaded:
+            self.hits += 1
+            self.loaded.move_to_end(uuid_i)
+            return self.loaded[uuid_i]
+
+        self.misses += 1
+        if uuid_i in self.syncing:
+            system, job = self.syncing[uuid_i]
+            await shield(wrap_future(job))
+            return self._insert(uuid_i, system)
+
+        job = self.pending.get(uuid_i) or self._load_async(uuid)
+        self.requested.add(uuid_i)
+
+        # Shielded, so that a cancelled request does not cancel the shared load.
+        system = await shield(wrap_future(job))
+        return self.loaded.get(uuid_i, system)
+
+    def _load_async(self, uuid: UUID) -> Job:
+        """Start loading a System in the background, and return the Job of the
+            load. Finding the file, as well as reading or generating it, is done
+            by the Thread Pool. The System is added to the loaded Systems on the
+            Event Loop, as soon as it is done.
+        """
+        uuid_i = uuid.int
+        job = PREFETCHER.submit(self._load, uuid)
+        wrap_future(job).add_done_callback(partial(self._load_done, uuid_i, job))
+        self.pending[uuid_i] = job
+        return job
+
+    def _load_done(self, uuid_i: int, job: Job, future: Future) -> None:
+        if self.pending.get(uuid_i) is not job:
+            # Already taken up by a synchronous request.
+            return
+
+        del self.pending[uuid_i]
+        recent = uuid_i in self.requested
+        self.requested.discard(uuid_i)
+
+        if not future.cancelled() and future.exception() is None:
+            self._insert(uuid_i, future.result(), recent)
+
+    def prefetch(self, uuid: UUID, radius: float = None) -> List[Job]:
+        """Start loading, in the background, Systems within a radius of a
+            given System, by default the jump range. At most half of the
+            Capacity may be loading at once, and room is made for them by
+            evicting the least recently used Systems. Must be called from the
+            Event Loop. Return the Jobs of the loads started.
+        """
+        if radius is None:
+            radius = cfg.get("game/jumprange", 0.1)
+
+        row = self.index.get(id_key(uuid.int))
+        if row is None:
+            raise FileNotFoundError(f"System {uuid.hex!r} not found in Galaxy.")
+
+        budget = max(0, self.capacity // 2 - len(self.pending))
+        wanted = [
+            uuid_i
+            for *_pos, uuid_i in self.systems_at(self.stars[row], radius)
+            if uuid_i not in self.loaded
+            and uuid_i not in self.pending
+            and uuid_i not in self.syncing
+        ][:budget]
+
+        # Make room for every load now, rather than as each finishes, so that
+        #   the prefetched Systems do not evict each other.
+        self.evict(len(self.pending) + len(wanted))
+        return [self._load_async(UUID(int=uuid_i)) for uuid_i in wanted]
 
     def unload_system(self, system: SystemHandler) -> bool:
         if system.uuid in self.loaded:
@@ -140,10 +325,44 @@ class Galaxy(object):
             return False
 
     def unload_all(self) -> int:
-        return sum(1 for x in map(self.unload_system, self.loaded.values()) if x)
+        return sum(1 for x in map(self.unload_system, list(self.loaded.values())) if x)
+
+    def evict(self, reserve: int = 0) -> int:
+        """Unload the least recently used Systems which are not pinned, until
+            no more than the Capacity, less a number of places to reserve, are
+            loaded. Return the number unloaded.
+        """
+        excess = len(self.loaded) + reserve - self.capacity
+        if excess <= 0:
+            return 0
+
+        victims = []
+        for system in self.loaded.values():
+            if len(victims) >= excess:
+                break
+            elif not system.pinned:
+                victims.append(system)
+
+        # Only remove the Systems here, and leave writing them to the Thread
+        #   Pool, so that the Event Loop never waits on the disk.
+        for system in victims:
+            del self.loaded[system.uuid]
+            job = PREFETCHER.submit(system.sync)
+            self.syncing[system.uuid] = (system, job)
+            job.add_done_callback(partial(self._sync_done, system.uuid))
+
+        self.evictions += len(victims)
+        return len(victims)
+
+    def _sync_done(self, uuid_i: int, job: Job) -> None:
+        # Called by the Thread Pool. The System may have been evicted again
+        #   since, with a newer Job.
+        entry = self.syncing.get(uuid_i)
+        if entry is not None and entry[1] is job:
+            del self.syncing[uuid_i]
 
     def render(self, *a, **kw):
-        render_galaxy(self.stars[..., :3], *a, **kw)
+        render_galaxy(self.stars, *a, **kw)
 
     def rename(self, target: Path):
         if not target.exists():
@@ -153,9 +372,12 @@ class Galaxy(object):
         else:
             raise FileExistsError(target)
 
-    def save(self):
+    def save(self, text: bool = False):
+        """Write the Galaxy to storage, with its Stars in the binary Catalogue,
+            and also in the text format if requested.
+        """
         p_data = self.gdir / cfg["data/meta", "meta.yml"]
-        p_stars = self.gdir / cfg["data/stars", "STARS"]
+        p_cat = self.gdir / cfg["data/catalogue", "STARS.npy"]
         self.ensure()
 
         for system in self.loaded.values():
@@ -166,26 +388,65 @@ class Galaxy(object):
             safe_dump({"uuid": self.gid.hex}, fd)
         tmp.rename(p_data)
 
-        tmp = p_stars.with_suffix(".TMP")
-        with tmp.open("w") as fd:
-            fd.writelines(LINE(*star[:3], UUID(int=star[3]).hex) for star in self.stars)
-        tmp.rename(p_stars)
+        write_catalogue(p_cat, self.stars, self.ids)
+        if text:
+            write_text(self.gdir / cfg["data/stars", "STARS"], self.stars, self.ids)
 
         return self.gdir
 
+    @property
+    def index(self) -> Dict[bytes, int]:
+        """Return a Dict mapping the UUID of every Star, as the Key given by
+            `id_key()`, to its row in the Arrays.
+        """
+        if self._index is None:
+            self._index = dict(zip(id_keys(self.ids), range(len(self.ids))))
+        return self._index
+
+    @property
+    def tree(self) -> cKDTree:
+        """Return a KD-Tree over the Positions of every Star."""
+        if self._tree is None:
+            self._tree = cKDTree(self.stars)
+        return self._tree
+
+    def star(self, row: int) -> Tuple[float, float, float, int]:
+        """Return the Position and UUID Integer of the Star in a given row."""
+        hi, lo = self.ids[row].tolist()
+        return (*self.stars[row].tolist(), (hi << 64) | lo)
+
     def systems_at(
         self, pos: np.ndarray, radius: float = 0
     ) -> Tuple[Tuple[float, float, float, int], ...]:
-        return tuple(x for x in self.stars if norm(x[:3] - pos) <= radius)
+        """Return every Star within a given distance of a Position."""
+        rows = self.tree.query_ball_point(pos, radius)
+        return tuple(map(self.star, sorted(rows)))
+
+    def systems_nearest(
+        self, pos: np.ndarray, k: int = 1
+    ) -> Tuple[Tuple[float, float, float, int], ...]:
+        """Return the `k` Stars nearest a Position, nearest first."""
+        _dist, rows = self.tree.query(pos, k=[*range(1, k + 1)])
+        return tuple(self.star(row) for row in rows if row < len(self.stars))
+
+    def systems_within(
+        self, low: np.ndarray, high: np.ndarray
+    ) -> Tuple[Tuple[float, float, float, int], ...]:
+        """Return every Star inside an axis-aligned Box, given by the corners
+            with the lowest and highest values on every axis.
+        """
+        centre = (np.asarray(low) + high) / 2
+        half = (np.asarray(high) - low) / 2
+
+        # Query the Cube enclosing the Box, and then trim it to the Box.
+        rows = np.array(self.tree.query_ball_point(centre, half.max(), p=np.inf))
+        if rows.size:
+            rows = np.sort(rows[np.all(np.abs(self.stars[rows] - centre) <= half, 1)])
+        return tuple(map(self.star, rows))
 
     def system_by_uuid(self, uuid: UUID) -> Optional[Tuple[float, float, float, int]]:
-        # Find Indices of all Stars with a matching UUID.
-        indices = np.where(self.stars[..., 3] == uuid.int)[0].tolist()
-        if indices:
-            # Return the Data at the first Index.
-            return tuple(self.stars[indices[0]].tolist())
-        else:
-            return None
+        row = self.index.get(id_key(uuid.int))
+        return None if row is None else self.star(row)
 
     def system_random(self) -> Tuple[float, float, float, int]:
-        return choice(self.stars)
+        return self.star(randbelow(len(self.stars)))
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional, TYPE_CHECKING
 
 from astropy.units import Quantity
 
@@ -6,12 +7,22 @@ from ..objects import Data
 from ..serial import Node
 from ..units import Units, UNITS_PLANET
 
+if TYPE_CHECKING:
+    from ..space.orbit import Orbit
 
-class Body(Node, ABC):
-    __slots__ = ("data",)
 
-    def __init__(self, mass: float, radius: float, units: Units = UNITS_PLANET):
+class Body(Node, ABC):
+    __slots__ = ("data", "orbit")
+
+    def __init__(
+        self,
+        mass: float,
+        radius: float,
+        units: Units = UNITS_PLANET,
+        orbit: "Orbit" = None,
+    ):
         self.data = Data(mass, radius, units)
+        self.orbit: Optional["Orbit"] = orbit
 
     @property
     def mass(self) -> float:
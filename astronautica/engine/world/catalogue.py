@@ -0,0 +1,128 @@
+"""Catalogue Module: Dedicated to the storage of the Stars of a Galaxy on disk.
+
+The Catalogue is a binary NumPy file of one fixed-size record per Star, which
+    is mapped into memory rather than read, so that even a very large Galaxy
+    loads instantly, and only the pages actually touched are ever read. The
+    128-bit UUID of each Star is split into two 64-bit halves, most significant
+    first.
+
+The older text format, one line of delimited values per Star, is still
+    supported for import and export.
+"""
+
+from pathlib import Path
+from secrets import token_bytes
+from typing import Tuple
+from uuid import UUID
+
+import numpy as np
+
+
+__all__ = [
+    "id_key",
+    "id_keys",
+    "ids_to_ints",
+    "ints_to_ids",
+    "new_ids",
+    "read_catalogue",
+    "read_text",
+    "STAR_DTYPE",
+    "write_catalogue",
+    "write_text",
+]
+
+
+DELIM = "|"
+LINE = (DELIM.join((*(["{: = 23}"] * 3), "{}")) + "\n").format
+
+STAR_DTYPE = np.dtype([("pos", "<f8", (3,)), ("id", "<u8", (2,))])
+MASK_64 = (1 << 64) - 1
+
+
+def ints_to_ids(ints) -> np.ndarray:
+    """Split 128-bit Integers into an (N, 2) Array of their 64-bit halves."""
+    return np.array([(i >> 64, i & MASK_64) for i in ints], np.uint64).reshape(
+        (-1, 2)
+    )
+
+
+def ids_to_ints(ids: np.ndarray) -> list:
+    """Join an (N, 2) Array of 64-bit halves back into 128-bit Integers."""
+    return [(int(hi) << 64) | int(lo) for hi, lo in ids.tolist()]
+
+
+def id_key(uuid: int) -> bytes:
+    """Return the Key under which a 128-bit UUID Integer is found by
+        `id_keys()`.
+    """
+    return np.array((uuid >> 64, uuid & MASK_64), np.uint64).tobytes()
+
+
+def id_keys(ids: np.ndarray) -> list:
+    """Return a hashable Key for every row of an (N, 2) Array of 64-bit
+        halves: the raw sixteen bytes of the row. This is much faster than
+        joining the halves into Integers.
+    """
+    return np.ascontiguousarray(ids, np.uint64).view("V16").ravel().tolist()
+
+
+def new_ids(count: int) -> np.ndarray:
+    """Return an (N, 2) Array of the halves of N new random (version 4) UUIDs,
+        drawn all at once from a secure source.
+    """
+    ids = np.frombuffer(token_bytes(16 * count), ">u8").reshape((count, 2))
+    ids = ids.astype(np.uint64)
+    # Version 4, and the variant of RFC 4122.
+    ids[:, 0] = (ids[:, 0] & np.uint64(~0xF000 & MASK_64)) | np.uint64(0x4000)
+    ids[:, 1] = (ids[:, 1] & np.uint64(MASK_64 >> 2)) | np.uint64(1 << 63)
+    return ids
+
+
+def read_catalogue(path: Path) -> np.memmap:
+    """Map a binary Catalogue into memory, read-only. The records have fields
+        "pos" and "id", as in `STAR_DTYPE`.
+    """
+    stars = np.load(path, mmap_mode="r", allow_pickle=False)
+    if stars.dtype != STAR_DTYPE:
+        raise ValueError(f"Not a Star Catalogue: {path}")
+    return stars
+
+
+def write_catalogue(path: Path, pos: np.ndarray, ids: np.ndarray) -> None:
+    """Write the Positions and IDs of Stars as a binary Catalogue, replacing
+        any existing file only once the new one is complete.
+    """
+    tmp = path.with_suffix(".TMP")
+    out = np.lib.format.open_memmap(tmp, "w+", STAR_DTYPE, (len(pos),))
+    out["pos"] = pos
+    out["id"] = ids
+    out.flush()
+    del out
+
+    tmp.replace(path)
+
+
+def read_text(path: Path) -> Tuple[np.ndarray, np.ndarray]:
+    """Read the Positions and IDs of Stars from the text format."""
+    pos = []
+    ids = []
+
+    with path.open("r") as file:
+        for line in file:
+            if line.count(DELIM) == 3:
+                x, y, z, h = line.strip("\n").replace(" ", "").split(DELIM)
+                pos.append((float(x), float(y), float(z)))
+                ids.append(UUID(hex=h).int)
+
+    return np.array(pos, float).reshape((-1, 3)), ints_to_ids(ids)
+
+
+def write_text(path: Path, pos: np.ndarray, ids: np.ndarray) -> None:
+    """Write the Positions and IDs of Stars in the text format."""
+    tmp = path.with_suffix(".TMP")
+    with tmp.open("w") as fd:
+        fd.writelines(
+            LINE(*xyz, UUID(int=i).hex)
+            for xyz, i in zip(pos.tolist(), ids_to_ints(ids))
+        )
+    tmp.replace(path)
@@ -5,14 +5,20 @@ from numba import jit
 import numpy as np
 from numpy import random as npr
 
-from engine.space.geometry import from_spherical, to_spherical
+from engine.space.geometry import (
+    from_spherical,
+    from_spherical_array,
+    to_spherical_array,
+)
 
 
 def apply_swirl(stars: np.ndarray, deg: float, factor: float) -> None:
-    for star in stars:
-        rho, theta, phi = to_spherical(*star)
-        new = from_spherical(rho, theta, phi - deg - (deg * factor * rho))
-        star[:] = new
+    if len(stars) == 0:
+        return
+
+    spherical = to_spherical_array(stars)
+    spherical[:, 2] -= deg + deg * factor * spherical[:, 0]
+    stars[:] = from_spherical_array(spherical)
 
 
 @jit(forceobj=True)
@@ -20,18 +26,8 @@ def offset(percent: float = 15) -> float:
     return 1 + ((randbelow(percent * 2) - percent) / 100)
 
 
-@jit(forceobj=True)
 def generate_stars(count: int, sigma, center) -> np.ndarray:
-    return np.array(
-        [
-            (
-                npr.normal(center[0], sigma[0]),
-                npr.normal(center[1], sigma[1]),
-                npr.normal(center[2], sigma[2]),
-            )
-            for _ in range(count)
-        ]
-    )
+    return npr.normal(center, sigma, (count, 3))
 
 
 def generate_galaxy(
@@ -58,11 +54,11 @@ def generate_galaxy(
 
     cluster_arrays = []
     for _ in range(clusters):
-        cluster_arrays.extend(
+        cluster_arrays.append(
             generate_stars(
                 int(stars_per_cluster * offset()),
-                (h := size / 2),
-                from_spherical(npr.normal(0, h), 0, randbelow(360)),
+                size / 2,
+                from_spherical(npr.normal(0, radius / 2), 0, randbelow(360)),
             )
         )
     cluster_arrays = np.concatenate(cluster_arrays) if cluster_arrays else np.array([])
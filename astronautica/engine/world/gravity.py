@@ -1,8 +1,10 @@
-from typing import List
+from typing import List, Optional, Tuple
 
 from astropy import units as u
+import numpy as np
 
 from ..serial import Node
+from ..space.orbit import lagrange_points, propagate
 
 
 class Orbit(object):
@@ -22,7 +24,7 @@ class MultiSystem(List[Node], Node):
         if len(bodies) < 2:
             raise ValueError("A Multi System must have at least two Objects.")
 
-        super().__init__(self, bodies)
+        super().__init__(bodies)
 
     @property
     def mass(self):
@@ -44,17 +46,42 @@ class System(List[Node], Node):
         the case for Planetary Systems orbiting a single Star.
     """
 
-    __slots__ = ("primary",)
+    __slots__ = ("_lagrange", "primary")
 
     def __init__(self, primary: Node, *satellites: Node):
         self.primary: Node = primary
+        self._lagrange: Optional[Tuple[float, np.ndarray, np.ndarray]] = None
 
-        super().__init__(self, satellites)
+        super().__init__(satellites)
 
     @property
     def mass(self):
         return sum((o.mass for o in self), self.primary.mass)
 
+    def lagrange_points(self, time: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the Positions and Velocities of the Lagrangian Points of every
+            Satellite at a given Time, relative to the Primary, each shaped
+            (N, 5, 3). Row `i` belongs to Satellite `i`, and column `k` to
+            Point L(k+1).
+
+        Every Satellite must have an Orbit. The result for the latest Time is
+            cached, so repeated queries within a Turn cost nothing; It must
+            not be modified in place.
+        """
+        if self._lagrange is not None and self._lagrange[0] == time:
+            return self._lagrange[1:]
+
+        pos, vel = propagate([sat.orbit for sat in self], time)
+        # Every Body keeps its Mass in its own Units, so compare Quantities.
+        primary = self.primary.mass_q
+        ratio = np.array(
+            [(sat.mass_q / primary).decompose().value for sat in self], dtype=float
+        )
+        points, rates = lagrange_points(pos, vel, ratio)
+
+        self._lagrange = (time, points, rates)
+        return points, rates
+
     def serialize(self):
         return dict(
             type=type(self).__name__,
@@ -13,6 +13,7 @@ from .tui import Interface
 from .users import key_free, KEYS, keys_new, LOGINS, Session
 from config import cfg
 from engine import CB_POST_TICK, Coordinates, Galaxy, Object, Spacetime, LocalSpace
+from engine.world import SystemHandler
 
 
 DATA_DIR = Path(cfg["data/directory"])
@@ -25,10 +26,17 @@ def setup_host(cli: Interface, cmd: CommandRoot, loop: AbstractEventLoop):
     server: Optional[Server] = None
     sessions: Dict[Remote, Session] = {}
 
-    st = Spacetime()
+    st = Spacetime(
+        workers=cfg.get("game/workers", 1),
+        adaptive=cfg.get("game/adaptive", False),
+        gravity=cfg.get("game/gravity"),
+        integrator=cfg.get("game/integrator"),
+    )
     local = LocalSpace(None, st.space)
     # space = st.space
     tcache = None
+    # The System the Host is currently in, pinned so that it stays loaded.
+    current: Optional[SystemHandler] = None
 
     def hostup():
         if st.world and st.world.gdir:
@@ -48,9 +56,24 @@ def setup_host(cli: Interface, cmd: CommandRoot, loop: AbstractEventLoop):
                 if st.world and st.world.stars.shape
                 else None
             ),
+            "Systems: {}".format(
+                f"{st.world.hits} hit, {st.world.misses} miss,"
+                f" {st.world.evictions} evict"
+                if st.world
+                else None
+            ),
         )
     )
 
+    def enter(system: Optional[SystemHandler]):
+        nonlocal current
+
+        if current is not None:
+            current.unpin()
+        if system is not None:
+            system.pin()
+        current = system
+
     def invalidate_tcache():
         nonlocal tcache
 
@@ -114,6 +137,7 @@ def setup_host(cli: Interface, cmd: CommandRoot, loop: AbstractEventLoop):
     async def new():
         """Generate a new Galaxy."""
         yield "Generating..."
+        enter(None)
         st.world = Galaxy.generate((1.4, 1, 0.2), arms=3)
         hostup()
         yield f"New Galaxy of {st.world.stars.shape[0]} stars generated."
@@ -124,10 +148,12 @@ def setup_host(cli: Interface, cmd: CommandRoot, loop: AbstractEventLoop):
         """Load a Galaxy from a file."""
         yield "Loading..."
         try:
-            st.world = Galaxy.from_file(DATA_DIR / "world" / path)
+            world = Galaxy.from_file(DATA_DIR / "world" / path)
         except NotADirectoryError:
             yield "Galaxy Directory not found."
         else:
+            enter(None)
+            st.world = world
             hostup()
             yield f"Loaded {st.world.stars.shape[0]} stars."
             refresh()
@@ -143,16 +169,21 @@ def setup_host(cli: Interface, cmd: CommandRoot, loop: AbstractEventLoop):
         return f"Galaxy Renamed. New location: {path}"
 
     @galaxy.sub
-    async def save():
-        """Write the Galaxy to storage."""
+    async def save(*, text: bool = False):
+        """Write the Galaxy to storage, optionally also exporting the Stars as
+            text.
+        """
         yield "Saving..."
-        st.world.save()
+        st.world.save(text)
         yield f"Galaxy Saved in: {st.world.gdir}"
 
     @galaxy.sub
     async def rand():
-        """Fetch a randomly-selected System."""
-        yield repr(st.world.get_system(UUID(int=st.world.system_random()[3])))
+        """Move to a randomly-selected System, and prefetch its neighbours."""
+        uuid = UUID(int=st.world.system_random()[3])
+        enter(await st.world.get_system_async(uuid))
+        yield repr(current)
+        yield f"Prefetching {len(st.world.prefetch(uuid))} neighbouring Systems."
 
     @cmd
     def who():
@@ -181,7 +212,8 @@ def setup_host(cli: Interface, cmd: CommandRoot, loop: AbstractEventLoop):
         co = Coordinates(local)
 
         if position:
-            co.position = position
+            # Relative to the Primary, as the Origin of the Domain floats.
+            co.position_absolute = position
         if velocity:
             co.velocity = velocity
         if heading:
@@ -193,6 +225,7 @@ def setup_host(cli: Interface, cmd: CommandRoot, loop: AbstractEventLoop):
 
         if mass:
             ob.data.mass = mass
+            ob.register()
 
         invalidate_tcache()
         refresh()
@@ -0,0 +1,12 @@
+"""The Game is run from within its own Directory, as `python astronautica`, so
+    its Modules import each other as top-level Packages, and its Configuration
+    is found beside `argv[0]`. Set up both the same way.
+"""
+
+import sys
+from pathlib import Path
+
+GAME = Path(__file__).parent.parent / "astronautica"
+
+sys.path.insert(0, str(GAME))
+sys.argv[0] = str(GAME)